@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Dict
 
@@ -28,25 +29,28 @@ from api.schemas import ConfigUpdateRequest
 # PROJECT_ROOT is the scraper repo root (parent of the api/ package)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 _CONFIG_PATH: Path = PROJECT_ROOT / "src" / "config.json"
+# Handlers below are sync so FastAPI runs the file I/O in its threadpool;
+# the lock keeps concurrent PUTs from interleaving their read-merge-write.
+_config_lock = threading.Lock()
 
 logger = logging.getLogger("api_server")
 router = APIRouter()
 
 
 @router.get("/config")
-async def get_config():
+def get_config():
     """Return the full scraper configuration from ``src/config.json``."""
     if not _CONFIG_PATH.exists():
         raise HTTPException(404, "Config file not found")
     try:
-        with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
+        with _config_lock, open(_CONFIG_PATH, "r", encoding="utf-8") as f:
             return json.load(f)
     except json.JSONDecodeError:
         raise HTTPException(500, "Config file contains invalid JSON")
 
 
 @router.put("/config")
-async def update_config(req: ConfigUpdateRequest):
+def update_config(req: ConfigUpdateRequest):
     """Update scraper configuration (deep-merge).
 
     Mirrors the CLI's **Configure Settings** screen.  Send the keys you
@@ -55,12 +59,6 @@ async def update_config(req: ConfigUpdateRequest):
     if not _CONFIG_PATH.exists():
         raise HTTPException(404, "Config file not found")
 
-    try:
-        with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
-            current = json.load(f)
-    except json.JSONDecodeError:
-        raise HTTPException(500, "Config file contains invalid JSON")
-
     def _deep_merge(base: Dict, overlay: Dict) -> None:
         for key, value in overlay.items():
             if (
@@ -72,10 +70,17 @@ async def update_config(req: ConfigUpdateRequest):
             else:
                 base[key] = value
 
-    _deep_merge(current, req.config)
+    with _config_lock:
+        try:
+            with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
+                current = json.load(f)
+        except json.JSONDecodeError:
+            raise HTTPException(500, "Config file contains invalid JSON")
+
+        _deep_merge(current, req.config)
 
-    with open(_CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(current, f, indent=2, ensure_ascii=False)
+        with open(_CONFIG_PATH, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
 
     logger.info("Configuration updated via API")
     return {"status": "ok", "config": current}
@@ -20,11 +20,12 @@ import json
 import logging
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from api.state import _state, _state_lock, _results_state, _results_state_lock, _scrape_history
 
@@ -51,6 +52,26 @@ def _flatten_dict(
     return dict(items)
 
 
+@lru_cache(maxsize=2)
+def _render_output(path: str, mtime_ns: int, size: int) -> bytes:
+    """Parse and re-encode an output file the way JSONResponse would.
+
+    Keyed on (mtime, size) so a rewritten file is read again. Only the
+    immutable encoded body is cached, never the parsed dict.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _output_body(json_path: Path) -> bytes:
+    """Return the JSON response body for an output file, reusing it while unchanged."""
+    st = json_path.stat()
+    return _render_output(str(json_path), st.st_mtime_ns, st.st_size)
+
+
 @router.get("/status")
 async def get_status():
     """Return scraper state and a summary of the last completed scrape.
@@ -128,7 +149,8 @@ async def get_status():
 @router.get("/history")
 async def get_history(limit: int = Query(50, ge=1, le=200)):
     """Return recent scrape runs (in-memory, last *limit* entries)."""
-    return {"runs": _scrape_history[-limit:], "total": len(_scrape_history)}
+    runs = list(_scrape_history)
+    return {"runs": runs[-limit:], "total": len(runs)}
 
 
 @router.get("/outputs")
@@ -164,8 +186,10 @@ async def list_outputs():
     return {"match_files": match_files, "results_files": results_files}
 
 
+# The two download handlers are sync so FastAPI runs their file I/O in its
+# threadpool instead of on the event loop (same as the /config handlers).
 @router.get("/outputs/{filename:path}")
-async def get_output(filename: str):
+def get_output(filename: str):
     """Download a specific JSON output file (e.g. ``matches_250614.json``)."""
     # Prevent directory traversal
     sanitised = Path(filename).name
@@ -173,14 +197,13 @@ async def get_output(filename: str):
     if not json_path.exists() or not json_path.is_file():
         raise HTTPException(404, f"File '{sanitised}' not found")
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return Response(content=_output_body(json_path), media_type="application/json")
     except json.JSONDecodeError:
         raise HTTPException(500, "File contains invalid JSON")
 
 
 @router.get("/outputs/{filename:path}/csv")
-async def get_output_csv(filename: str):
+def get_output_csv(filename: str):
     """Download a specific JSON output file as CSV (flattened)."""
     sanitised = Path(filename).name
     json_path = PROJECT_ROOT / "output" / "json" / sanitised
@@ -8,7 +8,7 @@ Contains:
   - _state_lock — guards all _state mutations
   - _executor — single-worker ThreadPoolExecutor for scrape runs
   - _stream_executor — 3-worker pool for per-match streaming to engine
-  - _scrape_history — list of finished-run summaries (for /api/history)
+  - _scrape_history — ring buffer of finished-run summaries (for /api/history)
   - _stream_match_to_engine — per-match streaming helper
   - _run_scheduled_scrape — background runner for FlashscoreScraper.scrape()
   - _run_results_scrape — background runner for FlashscoreScraper.scrape_results()
@@ -25,10 +25,11 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from fastapi import HTTPException
 
@@ -46,8 +47,9 @@ _executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
 # complete — keeps the scraper thread moving without waiting on HTTP.
 _stream_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=3)
 
-# Scrape run history (in-memory, most-recent-first when served)
-_scrape_history: List[Dict[str, Any]] = []
+# Scrape run history (in-memory ring buffer, oldest entries drop off)
+_SCRAPE_HISTORY_CAPACITY = 200
+_scrape_history: deque = deque(maxlen=_SCRAPE_HISTORY_CAPACITY)
 
 
 class _ScraperState:
@@ -33,11 +33,19 @@ from src.models import MatchModel, OddsModel, H2HMatchModel
 from .performance_display import PerformanceDisplay
 from src.core.performance_monitor import PerformanceMonitor
 
+# First integer in a captured log line (scheduled/processed/collected counts)
+_NUMBER_RE = re.compile(r'\d+')
+
 class CLIManager:
     def clear_terminal(self):
         """Clear the terminal screen in a cross-platform way."""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            # Legacy Windows consoles may not interpret ANSI escapes
+            os.system('cls')
+            return
+        # Erase display and home the cursor directly instead of spawning a shell
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.flush()
 
     def __init__(self):
         """Initialize the CLI manager."""
@@ -80,6 +88,10 @@ class CLIManager:
             r'Registration response error message.*',
             r'google_apis.*registration_request.*'
         ]
+        # One alternation compiled up front; every captured log line is checked against it
+        self._browser_noise_re = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in self.browser_noise_patterns), re.IGNORECASE
+        )
         self.debug = False
         self.performance_display = PerformanceDisplay()
         self.performance_display.set_stop_callback(self._stop_scraper)
@@ -162,6 +174,11 @@ class CLIManager:
         
         self.logger.info("🛑 Stopping scraper...")
         self._should_stop_scraper = True
+        # Don't let a retry backoff hold the scraper thread past the stop
+        try:
+            self.scraper.cancel_retries()
+        except Exception as e:
+            self.logger.debug(f"Cancelling retries failed: {e}")
         
         try:
             # Stop any running performance monitoring
@@ -1559,10 +1576,7 @@ class CLIManager:
 
     def _is_browser_noise(self, message):
         """Check if a message is browser noise that should be filtered out."""
-        for pattern in self.browser_noise_patterns:
-            if re.search(pattern, message, re.IGNORECASE):
-                return True
-        return False
+        return self._browser_noise_re.search(message) is not None
 
     def _display_log_update(self, message):
         """Display log updates in the UI.
@@ -1574,7 +1588,7 @@ class CLIManager:
         Only update in-memory UI state (critical_messages, performance monitor).
         """
         # Filter out browser noise
-        if any(re.search(pattern, message, re.IGNORECASE) for pattern in self.browser_noise_patterns):
+        if self._is_browser_noise(message):
             return
         
         # Check for critical messages (in-memory only, no self.logger call!)
@@ -1722,9 +1736,8 @@ class CLIManager:
 
     def _extract_number(self, text):
         """Extract number from text."""
-        import re
-        numbers = re.findall(r'\d+', text)
-        return int(numbers[0]) if numbers else 0
+        match = _NUMBER_RE.search(text)
+        return int(match.group()) if match else 0
 
     # =====================
     # Scheduling utilities
@@ -2095,7 +2108,7 @@ class CLIManager:
                 import json
                 with open(settings_file, 'r') as f:
                     return json.load(f)
-            except:
+            except (OSError, ValueError):
                 pass
         return {}
 
@@ -77,85 +77,87 @@ class ConsoleDisplay:
 
     def show_scraping_results(self, results, critical_messages):
         """Show detailed scraping results."""
-        self.console.print("\n" + "="*60)
-        self.console.print("[bold green]📊 SCRAPING RESULTS[/bold green]")
-        self.console.print("="*60)
+        # Buffer the whole report and emit it as a single write on exit
+        with self.console:
+            self.console.print("\n" + "="*60)
+            self.console.print("[bold green]📊 SCRAPING RESULTS[/bold green]")
+            self.console.print("="*60)
         
-        # Show basic statistics
-        if results:
-            table = Table(title="Scraping Statistics", box=box.ROUNDED)
-            table.add_column("Metric", style="cyan")
-            table.add_column("Count", style="green")
+            # Show basic statistics
+            if results:
+                table = Table(title="Scraping Statistics", box=box.ROUNDED)
+                table.add_column("Metric", style="cyan")
+                table.add_column("Count", style="green")
             
-            if 'scheduled_matches' in results:
-                table.add_row("Scheduled Matches", str(results['scheduled_matches']))
-            if 'processed_matches' in results:
-                table.add_row("Previously Processed", str(results['processed_matches']))
-            if 'skipped_matches' in results:
-                table.add_row("Skipped Matches", str(results['skipped_matches']))
-            if 'new_matches' in results:
-                table.add_row("New Matches Processed", str(results['new_matches']))
-            if 'total_collected' in results:
-                table.add_row("Total Collected", str(results['total_collected']))
+                if 'scheduled_matches' in results:
+                    table.add_row("Scheduled Matches", str(results['scheduled_matches']))
+                if 'processed_matches' in results:
+                    table.add_row("Previously Processed", str(results['processed_matches']))
+                if 'skipped_matches' in results:
+                    table.add_row("Skipped Matches", str(results['skipped_matches']))
+                if 'new_matches' in results:
+                    table.add_row("New Matches Processed", str(results['new_matches']))
+                if 'total_collected' in results:
+                    table.add_row("Total Collected", str(results['total_collected']))
             
-            self.console.print(table)
+                self.console.print(table)
             
-            # Show detailed statistics if available
-            detailed_stats = []
-            if 'complete_matches' in results or 'incomplete_matches' in results:
-                complete = results.get('complete_matches', 0)
-                incomplete = results.get('incomplete_matches', 0)
-                total_processed = complete + incomplete
-                if total_processed > 0:
-                    success_rate = (complete / total_processed) * 100
-                    detailed_stats.append(f"Complete Matches: {complete}")
-                    detailed_stats.append(f"Incomplete Matches: {incomplete}")
-                    detailed_stats.append(f"Success Rate: {success_rate:.1f}%")
+                # Show detailed statistics if available
+                detailed_stats = []
+                if 'complete_matches' in results or 'incomplete_matches' in results:
+                    complete = results.get('complete_matches', 0)
+                    incomplete = results.get('incomplete_matches', 0)
+                    total_processed = complete + incomplete
+                    if total_processed > 0:
+                        success_rate = (complete / total_processed) * 100
+                        detailed_stats.append(f"Complete Matches: {complete}")
+                        detailed_stats.append(f"Incomplete Matches: {incomplete}")
+                        detailed_stats.append(f"Success Rate: {success_rate:.1f}%")
             
-            if 'matches_collected_today' in results and results['matches_collected_today'] > 0:
-                detailed_stats.append(f"Matches Collected Today: {results['matches_collected_today']}")
+                if 'matches_collected_today' in results and results['matches_collected_today'] > 0:
+                    detailed_stats.append(f"Matches Collected Today: {results['matches_collected_today']}")
             
-            if detailed_stats:
-                self.console.print("\n[bold cyan]📈 DETAILED STATISTICS[/bold cyan]")
-                for stat in detailed_stats:
-                    self.console.print(f"[dim]• {stat}[/dim]")
+                if detailed_stats:
+                    self.console.print("\n[bold cyan]📈 DETAILED STATISTICS[/bold cyan]")
+                    for stat in detailed_stats:
+                        self.console.print(f"[dim]• {stat}[/dim]")
             
-            # Show skip reasons if available
-            if 'skip_reasons' in results and results['skip_reasons']:
-                self.console.print("\n[bold yellow]⏭️  SKIP REASONS[/bold yellow]")
-                for reason, count in results['skip_reasons'].items():
-                    # Clean up the reason text to ensure proper formatting
-                    clean_reason = reason.strip()
-                    if clean_reason and not clean_reason.endswith(')'):
-                        clean_reason += ')'
-                    self.console.print(f"[dim]• {clean_reason}: {count} matches[/dim]")
+                # Show skip reasons if available
+                if 'skip_reasons' in results and results['skip_reasons']:
+                    self.console.print("\n[bold yellow]⏭️  SKIP REASONS[/bold yellow]")
+                    for reason, count in results['skip_reasons'].items():
+                        # Clean up the reason text to ensure proper formatting
+                        clean_reason = reason.strip()
+                        if clean_reason and not clean_reason.endswith(')'):
+                            clean_reason += ')'
+                        self.console.print(f"[dim]• {clean_reason}: {count} matches[/dim]")
         
-        # Show critical messages if any
-        if critical_messages:
-            self.console.print("\n[bold yellow]⚠️  BROWSER/DRIVER MESSAGES[/bold yellow]")
-            for msg in critical_messages:
-                if 'error:' in msg.lower():
-                    self.console.print(f"[red]{msg}[/red]")
-                elif 'warning:' in msg.lower():
-                    self.console.print(f"[yellow]{msg}[/yellow]")
-                elif 'devtools' in msg.lower():
-                    self.console.print(f"[blue]{msg}[/blue]")
-                else:
-                    self.console.print(f"[dim]{msg}[/dim]")
+            # Show critical messages if any
+            if critical_messages:
+                self.console.print("\n[bold yellow]⚠️  BROWSER/DRIVER MESSAGES[/bold yellow]")
+                for msg in critical_messages:
+                    if 'error:' in msg.lower():
+                        self.console.print(f"[red]{msg}[/red]")
+                    elif 'warning:' in msg.lower():
+                        self.console.print(f"[yellow]{msg}[/yellow]")
+                    elif 'devtools' in msg.lower():
+                        self.console.print(f"[blue]{msg}[/blue]")
+                    else:
+                        self.console.print(f"[dim]{msg}[/dim]")
         
-        # Show summary
-        if results.get('total_collected', 0) > 0:
-            self.console.print(f"\n[bold green]✅ Successfully collected {results['total_collected']} matches![/bold green]")
-        elif results.get('skipped_matches', 0) > 0:
-            self.console.print(f"\n[bold yellow]ℹ️  Skipped {results['skipped_matches']} matches (already processed).[/bold yellow]")
-            if 'skip_reasons' in results and results['skip_reasons']:
-                reasons = list(results['skip_reasons'].keys())
-                if reasons:
-                    self.console.print(f"[dim]Main reasons: {', '.join(reasons[:3])}[/dim]")
-        else:
-            self.console.print(f"\n[bold blue]ℹ️  No new matches found to process.[/bold blue]")
+            # Show summary
+            if results.get('total_collected', 0) > 0:
+                self.console.print(f"\n[bold green]✅ Successfully collected {results['total_collected']} matches![/bold green]")
+            elif results.get('skipped_matches', 0) > 0:
+                self.console.print(f"\n[bold yellow]ℹ️  Skipped {results['skipped_matches']} matches (already processed).[/bold yellow]")
+                if 'skip_reasons' in results and results['skip_reasons']:
+                    reasons = list(results['skip_reasons'].keys())
+                    if reasons:
+                        self.console.print(f"[dim]Main reasons: {', '.join(reasons[:3])}[/dim]")
+            else:
+                self.console.print(f"\n[bold blue]ℹ️  No new matches found to process.[/bold blue]")
         
-        self.console.print("="*60)
+            self.console.print("="*60)
 
     def show_initializing(self):
         """Show initialization message."""
@@ -10,9 +10,10 @@ import os
 import sys
 import time
 import threading
-from typing import Dict, List, Any, Optional, Callable
+from typing import Deque, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
 import logging
+from functools import lru_cache
 
 # Simple color constants for ANSI escape codes
 class Colors:
@@ -51,6 +52,70 @@ from threading import Lock
 from datetime import datetime
 from collections import deque
 
+def _pct_color(p: float) -> str:
+    """Color for a load percentage (higher is worse)."""
+    if p >= 80:
+        return "red"
+    if p >= 50:
+        return "yellow"
+    return "green"
+
+
+def _fmt_mb(mb: float) -> str:
+    return f"{mb/1024:.1f} GB" if mb >= 1024 else f"{mb:.1f} MB"
+
+
+def _fmt_memory(value: Any) -> Tuple[str, str]:
+    return _fmt_mb(float(value)), "bold white"
+
+
+def _fmt_cpu(value: Any) -> Tuple[str, str]:
+    cpu_pct = float(value)
+    return f"{cpu_pct:.1f}%", f"bold {_pct_color(cpu_pct)}"
+
+
+def _fmt_success_rate(value: Any) -> Tuple[str, str]:
+    sr = float(value)
+    # For success rate, invert (higher is better)
+    color = "green" if sr >= 80 else ("yellow" if sr >= 50 else "red")
+    return f"{sr:.1f}%", f"bold {color}"
+
+
+def _fmt_seconds(value: Any) -> Tuple[str, str]:
+    v = float(value)
+    if v > 0 and v < 0.01:
+        v = 0.01
+    return f"{v:.2f}s", "bold white"
+
+
+def _fmt_plain(value: Any) -> Tuple[str, str]:
+    return str(value), "bold white"
+
+
+@lru_cache(maxsize=256, typed=True)
+def _format_cached(formatter: Callable[[Any], Tuple[str, str]], value: Any) -> Tuple[str, str]:
+    try:
+        return formatter(value)
+    except Exception:
+        return str(value), "bold white"
+
+
+def _format_metric(formatter: Callable[[Any], Tuple[str, str]], value: Any) -> Tuple[str, str]:
+    """Format a metric value as (text, style), falling back to its plain string.
+
+    Gauges often repeat the same value between renders, so results are memoized;
+    unhashable values are formatted directly.
+    """
+    try:
+        return _format_cached(formatter, value)
+    except TypeError:
+        pass
+    try:
+        return formatter(value)
+    except Exception:
+        return str(value), "bold white"
+
+
 class PerformanceDisplay:
     """
     Rich-based dynamic console display for performance metrics and progress bars.
@@ -60,10 +125,23 @@ class PerformanceDisplay:
     - Alerts panel (optional)
     - Thread-safe updates
     """
-    def __init__(self):
+    MAX_MESSAGES = 200
+
+    # (metrics key, label, formatter) for the primary rows of the metrics panel
+    _METRIC_ROWS = (
+        ("memory_usage", "Memory", _fmt_memory),
+        ("cpu_usage", "CPU", _fmt_cpu),
+        ("active_workers", "Workers", _fmt_plain),
+        ("tasks_processed", "Tasks", _fmt_plain),
+        ("success_rate", "Success", _fmt_success_rate),
+        ("average_processing_time", "Avg Time", _fmt_seconds),
+    )
+
+    def __init__(self, console: Optional[Console] = None):
         # Local logger to avoid NameError in exception handlers
         self._logger = logging.getLogger(__name__)
-        self.console = Console()
+        # Injectable so callers (and tests) can direct output away from the terminal
+        self.console = console or Console()
         self.layout = Layout()
         self.metrics: Dict[str, Any] = {}
         self.progress_total = 100
@@ -81,9 +159,19 @@ class PerformanceDisplay:
         self._schedule_next_dt: Optional[datetime] = None
         self.alert_message = None
         self.alert_type = "info"
-        self.messages: List[tuple] = []
+        # Bounded like subtasks: a long scrape appends messages for hours
+        self.messages: Deque[tuple] = deque(maxlen=self.MAX_MESSAGES)
         self.lock = Lock()
-        self._last_schedule_refresh_ts = 0.0
+        self._last_schedule_refresh_ns = 0
+        # Inputs each layout region was last rendered from; unchanged regions are skipped
+        self._last_rendered: Dict[str, Any] = {}
+        # Set by update_* callers; the display loop coalesces these into one render
+        self._refresh_pending = False
+        # Last whole percent requested per bar ("overall"/"batch"); the bars only
+        # show integer percentages, so sub-percent steps need no redraw
+        self._progress_percent: Dict[str, int] = {}
+        # Metric labels never change; build their Text cells once and reuse them
+        self._metric_labels = tuple(Text(label, style="bold cyan") for _, label, _ in self._METRIC_ROWS)
         
         # Initialize progress bars first
         self._progress = Progress(
@@ -106,6 +194,9 @@ class PerformanceDisplay:
             transient=False
         )
         self._batch_task = self._batch_progress.add_task("Batch", total=100)
+        # The Progress objects update in place, so their panels are built once
+        self._progress_panel = Panel(self._progress, title="[bold green]Overall Progress", border_style="green")
+        self._batch_panel = Panel(self._batch_progress, title="[bold yellow]Batch Progress", border_style="yellow")
         
         # Initialize controls before setting up layout
         self._stop_callback = None
@@ -121,6 +212,9 @@ class PerformanceDisplay:
         ]
         self._selected_control = 0
         self._paused = False
+        # Controls and tip panels only have a fixed set of states; build them once
+        self._controls_panels = tuple(self._build_controls_panel(idx) for idx in range(len(self._controls)))
+        self._tip_panel = self._build_tip_panel()
         
         # Now setup the layout which depends on the progress bars and controls
         self._setup_layout()
@@ -167,63 +261,13 @@ class PerformanceDisplay:
         table = Table.grid(padding=(0,1))
         table.add_column(justify="right", style="bold")
         table.add_column(justify="left")
-        metrics = self.metrics.copy()
-        # Helper for coloring percentages
-        def _pct_color(p: float) -> str:
-            try:
-                if p >= 80:
-                    return "red"
-                if p >= 50:
-                    return "yellow"
-                return "green"
-            except Exception:
-                return "white"
-
-        # Primary core metrics
-        for key, label in [
-            ("memory_usage", "Memory"),
-            ("cpu_usage", "CPU"),
-            ("active_workers", "Workers"),
-            ("tasks_processed", "Tasks"),
-            ("success_rate", "Success"),
-            ("average_processing_time", "Avg Time")
-        ]:
+        # Published snapshot; writers swap in a new dict instead of mutating this one
+        metrics = self.metrics
+        # Primary core metrics, formatted from a single table in one pass
+        for (key, _, formatter), label in zip(self._METRIC_ROWS, self._metric_labels):
             value = metrics.get(key, "--")
-            if key == "memory_usage" and value != "--":
-                try:
-                    mem_mb = float(value)
-                    if mem_mb >= 1024:
-                        value = f"{mem_mb/1024:.1f} GB"
-                    else:
-                        value = f"{mem_mb:.1f} MB"
-                except Exception:
-                    value = f"{value} MB"
-            elif key == "cpu_usage" and value != "--":
-                try:
-                    cpu_pct = float(value)
-                    color = _pct_color(cpu_pct)
-                    value = Text(f"{cpu_pct:.1f}%", style=f"bold {color}")
-                except Exception:
-                    value = f"{value:.1f}%"
-            elif key == "success_rate" and value != "--":
-                try:
-                    sr = float(value)
-                    # For success rate, invert (higher is better)
-                    color = "green" if sr >= 80 else ("yellow" if sr >= 50 else "red")
-                    value = Text(f"{sr:.1f}%", style=f"bold {color}")
-                except Exception:
-                    value = f"{value:.1f}%"
-            elif key == "average_processing_time" and value != "--":
-                try:
-                    v = float(value)
-                    if v > 0 and v < 0.01:
-                        v = 0.01
-                    value = f"{v:.2f}s"
-                except Exception:
-                    value = f"{value:.2f}s"
-            label_text = Text(f"{label}", style="bold cyan")
-            value_text = value if isinstance(value, Text) else Text(str(value), style="bold white")
-            table.add_row(label_text, value_text)
+            text, style = ("--", "bold white") if value == "--" else _format_metric(formatter, value)
+            table.add_row(label, Text(text, style=style))
 
         # Expanded memory section if system stats are available
         try:
@@ -234,25 +278,22 @@ class PerformanceDisplay:
             proc_mb = float(metrics.get("memory_usage", 0)) if metrics.get("memory_usage") is not None else 0.0
             if sys_total > 0:
                 sys_free = max(0.0, sys_total - sys_used)
-                # Helper for formatting MB/GB
-                def fmt_mb(mb: float) -> str:
-                    return f"{mb/1024:.1f} GB" if mb >= 1024 else f"{mb:.1f} MB"
                 # System totals
-                table.add_row(Text("System Total", style="bold cyan"), Text(fmt_mb(sys_total), style="bold white"))
+                table.add_row(Text("System Total", style="bold cyan"), Text(_fmt_mb(sys_total), style="bold white"))
                 table.add_row(
                     Text("System Used", style="bold cyan"),
-                    Text(f"{fmt_mb(sys_used)}  ({sys_percent:.1f}%)", style=f"bold {_pct_color(sys_percent)}")
+                    Text(f"{_fmt_mb(sys_used)}  ({sys_percent:.1f}%)", style=f"bold {_pct_color(sys_percent)}")
                 )
-                table.add_row(Text("System Free", style="bold cyan"), Text(fmt_mb(sys_free), style="bold white"))
+                table.add_row(Text("System Free", style="bold cyan"), Text(_fmt_mb(sys_free), style="bold white"))
                 # Process memory and peak
                 if proc_mb > 0:
                     proc_pct = (proc_mb / sys_total) * 100.0
                     table.add_row(
                         Text("Scraper (RSS)", style="bold cyan"),
-                        Text(f"{fmt_mb(proc_mb)}  ({proc_pct:.1f}% of total)", style=f"bold {_pct_color(proc_pct)}")
+                        Text(f"{_fmt_mb(proc_mb)}  ({proc_pct:.1f}% of total)", style=f"bold {_pct_color(proc_pct)}")
                     )
                 if peak_mb > 0:
-                    table.add_row(Text("Peak (RSS)", style="bold cyan"), Text(fmt_mb(peak_mb), style="bold white"))
+                    table.add_row(Text("Peak (RSS)", style="bold cyan"), Text(_fmt_mb(peak_mb), style="bold white"))
         except Exception:
             pass
         return Panel(table, title="[bold magenta]Performance Metrics", border_style="magenta")
@@ -261,9 +302,6 @@ class PerformanceDisplay:
         # Update progress bars
         self._progress.update(self._progress_task, completed=self.progress_current, total=max(self.progress_total,1), description=self.progress_desc or "Overall")
         self._batch_progress.update(self._batch_task, completed=self.batch_current, total=max(self.batch_total,1), description=self.batch_desc or "Batch")
-        # Compose progress panels
-        progress_panel = Panel(self._progress, title="[bold green]Overall Progress", border_style="green")
-        batch_panel = Panel(self._batch_progress, title="[bold yellow]Batch Progress", border_style="yellow")
 
         # Build Current Task content: match header, subtasks list, and recent messages
         task_table = Table.grid(padding=(0,1))
@@ -294,21 +332,7 @@ class PerformanceDisplay:
             if self.schedule_next_text:
                 if text_parts:
                     text_parts.append(Text("  •  ", style="dim"))
-                # Compute countdown if we have a parsed datetime
-                countdown_suffix = ""
-                try:
-                    if self._schedule_next_dt:
-                        remaining = int((self._schedule_next_dt - datetime.now()).total_seconds())
-                        if remaining < 0:
-                            remaining = 0
-                        mins, secs = divmod(remaining, 60)
-                        hours, mins = divmod(mins, 60)
-                        if hours > 0:
-                            countdown_suffix = f" (in {hours}h {mins}m {secs}s)"
-                        else:
-                            countdown_suffix = f" (in {mins}m {secs}s)"
-                except Exception:
-                    countdown_suffix = ""
+                countdown_suffix = self._schedule_countdown()
                 text_parts.append(Text(f"Next: {self.schedule_next_text}{countdown_suffix}", style="bold white"))
             if text_parts:
                 schedule_line = Text()
@@ -318,17 +342,6 @@ class PerformanceDisplay:
                 # Use a distinct border color for the schedule panel for better visibility
                 schedule_panel = Panel(schedule_row, title="[bold white]Schedule", border_style="cyan", expand=True)
 
-        # Tip panel shown under schedule with guidance for terminal zoom
-        tip_text = Text()
-        tip_text.append("• If text appears too large or panels overlap, reduce terminal zoom with Ctrl + -\n", style="bold cyan")
-        tip_text.append("• If text appears too small, increase terminal zoom with Ctrl + +", style="bold cyan")
-        tip_panel = Panel(
-            tip_text,
-            title="[bold white]Tip",
-            border_style="bright_black",
-            expand=True
-        )
-
         # Status panel now rendered in left column below metrics; omit here
 
         # Stack vertically using split
@@ -337,17 +350,33 @@ class PerformanceDisplay:
         # Make Current Task expand vertically to take remaining space
 
         layouts = [
-            Layout(progress_panel, size=4),
-            Layout(batch_panel, size=4),
+            Layout(self._progress_panel, size=4),
+            Layout(self._batch_panel, size=4),
             Layout(task_panel, ratio=1)
         ]
         if schedule_panel is not None:
             layouts.append(Layout(schedule_panel, size=3))
         # Always show the tip panel below schedule; give extra height for readability
-        layouts.append(Layout(tip_panel, size=4))
+        layouts.append(Layout(self._tip_panel, size=4))
         progress_stack.split(*layouts)
         return progress_stack
 
+    def _schedule_countdown(self) -> str:
+        """Return the countdown suffix for the next scheduled run, if known."""
+        try:
+            if self._schedule_next_dt:
+                remaining = int((self._schedule_next_dt - datetime.now()).total_seconds())
+                if remaining < 0:
+                    remaining = 0
+                mins, secs = divmod(remaining, 60)
+                hours, mins = divmod(mins, 60)
+                if hours > 0:
+                    return f" (in {hours}h {mins}m {secs}s)"
+                return f" (in {mins}m {secs}s)"
+        except Exception:
+            pass
+        return ""
+
     def _action_pause(self):
         self._paused = not self._paused
         if self._paused:
@@ -372,17 +401,33 @@ class PerformanceDisplay:
 
     def _action_refresh(self):
         self.show_alert("Refreshed.", "info")
-        self._refresh_layout()
+        with self.lock:
+            self._last_rendered.clear()
 
-    def _render_controls(self):
+    def _build_tip_panel(self):
+        # Tip panel shown under schedule with guidance for terminal zoom
+        tip_text = Text()
+        tip_text.append("• If text appears too large or panels overlap, reduce terminal zoom with Ctrl + -\n", style="bold cyan")
+        tip_text.append("• If text appears too small, increase terminal zoom with Ctrl + +", style="bold cyan")
+        return Panel(
+            tip_text,
+            title="[bold white]Tip",
+            border_style="bright_black",
+            expand=True
+        )
+
+    def _build_controls_panel(self, selected: int):
         controls = Text()
         for idx, (label, _) in enumerate(self._controls):
-            prefix = " > " if idx == self._selected_control else "   "
-            style = "bold white on blue" if idx == self._selected_control else "white"
+            prefix = " > " if idx == selected else "   "
+            style = "bold white on blue" if idx == selected else "white"
             controls.append(f"{prefix}{label}\n", style=style)
         controls.append("\n[Use ↑/↓ to navigate, Enter to select]", style="dim")
         return Panel(controls, title="[bold white]Controls", border_style="white")
 
+    def _render_controls(self):
+        return self._controls_panels[self._selected_control]
+
     def _render_alert(self):
         if not self.alert_message:
             return Panel("", title="", border_style="")
@@ -394,11 +439,32 @@ class PerformanceDisplay:
         }.get(self.alert_type, "cyan")
         return Panel(Text(self.alert_message, style=f"bold {color}"), title=f"[bold]{self.alert_type.title()}[/bold]", border_style=color)
 
+    def _update_region(self, name: str, region: Layout, signature: Any, render: Callable[[], Any]) -> None:
+        """Re-render a layout region only when its inputs changed since the last render."""
+        if name in self._last_rendered and self._last_rendered[name] == signature:
+            return
+        region.update(render())
+        self._last_rendered[name] = signature
+
     def _refresh_layout(self):
-        self.layout["header"].update(self._render_header())
-        # Update all panels once to render initial state
-        self.layout["body"]["left"]["metrics"].update(self._render_metrics())
-        # Render status indicators between metrics and controls
+        body = self.layout["body"]
+        self._update_region("header", self.layout["header"], (), self._render_header)
+        # Metrics and status indicators are published as whole new dicts, so the
+        # current references can serve as signatures without copying
+        self._update_region("metrics", body["left"]["metrics"], self.metrics, self._render_metrics)
+        self._update_region("status", body["left"]["status"], self.status_indicators, self._render_status)
+        progress_signature = (
+            self.progress_current, self.progress_total, self.progress_desc,
+            self._batch_task, self.batch_current, self.batch_total, self.batch_desc,
+            self.current_task, self.current_match, tuple(self.subtasks),
+            self.schedule_label, self.schedule_next_text, self._schedule_countdown()
+        )
+        self._update_region("progress", body["progress"], progress_signature, self._render_progress)
+        self._update_region("controls", body["left"]["controls"], self._selected_control, self._render_controls)
+        self._update_region("alert", self.layout["alert"], (self.alert_message, self.alert_type), self._render_alert)
+
+    def _render_status(self):
+        """Render status indicators shown between metrics and controls."""
         try:
             status_panel = None
             if self.status_indicators:
@@ -416,33 +482,50 @@ class PerformanceDisplay:
                         cells.append(Text.assemble(dot(state), Text(f" {name}", style="bold white")))
                     status_table.add_row(*cells)
                     status_panel = Panel(status_table, title="[bold white]Status", border_style="bright_black", expand=True)
-            self.layout["body"]["left"]["status"].update(status_panel or Panel("", border_style="bright_black"))
+            return status_panel or Panel("", border_style="bright_black")
         except Exception:
-            self.layout["body"]["left"]["status"].update(Panel("", border_style="bright_black"))
-        self.layout["body"]["progress"].update(self._render_progress())
-        self.layout["body"]["left"]["controls"].update(self._render_controls())
-        self.layout["alert"].update(self._render_alert())
+            return Panel("", border_style="bright_black")
 
     def update_metrics(self, metrics: Dict[str, Any]):
         with self.lock:
-            self.metrics.update(metrics)
-            self._refresh_layout()
+            # Copy-on-write: readers keep iterating the snapshot they grabbed
+            snapshot = dict(self.metrics)
+            snapshot.update(metrics)
+            self.metrics = snapshot
+            self._refresh_pending = True
+
+    def _progress_changed(self, bar: str, current: int, total: int) -> bool:
+        """Record the whole percent for ``bar`` and report whether it moved.
+
+        Completion always counts as a change so the final frame is drawn.
+        """
+        pct = 0 if not total else (current * 100) // total
+        if pct == self._progress_percent.get(bar) and current != total:
+            return False
+        self._progress_percent[bar] = pct
+        return True
 
     def update_progress(self, current: int, total: int, description: Optional[str] = None):
         with self.lock:
             self.progress_current = current
             self.progress_total = total
-            if description:
+            changed = self._progress_changed("overall", current, total)
+            if description and description != self.progress_desc:
                 self.progress_desc = description
-            self._refresh_layout()
+                changed = True
+            if changed:
+                self._refresh_pending = True
 
     def update_batch_progress(self, current: int, total: int, description: Optional[str] = None):
         with self.lock:
             self.batch_current = current
             self.batch_total = total
-            if description:
+            changed = self._progress_changed("batch", current, total)
+            if description and description != self.batch_desc:
                 self.batch_desc = description
-            self._refresh_layout()
+                changed = True
+            if changed:
+                self._refresh_pending = True
 
     def reset_batch_progress(self, total: int, description: Optional[str] = None):
         """Reset the batch progress timer and counters by recreating the task.
@@ -462,35 +545,36 @@ class PerformanceDisplay:
                 self._batch_task = self._batch_progress.add_task("Batch", total=1)
             self.batch_current = 0
             self.batch_total = int(total) if total else 1
+            self._progress_percent.pop("batch", None)
             if description:
                 self.batch_desc = description
-            self._refresh_layout()
+            self._refresh_pending = True
 
     def update_current_task(self, task: str):
         with self.lock:
             self.current_task = task
-            self._refresh_layout()
+            self._refresh_pending = True
 
     def update_current_match(self, task: str):
         with self.lock:
             self.current_match = task
-            self._refresh_layout()
+            self._refresh_pending = True
 
     def clear_subtasks(self):
         with self.lock:
             self.subtasks.clear()
-            self._refresh_layout()
+            self._refresh_pending = True
 
     def add_subtask(self, subtask: str):
         with self.lock:
             if subtask:
                 self.subtasks.append(subtask)
-                self._refresh_layout()
+                self._refresh_pending = True
 
     def update_status_indicators(self, indicators: Dict[str, str]):
         with self.lock:
             self.status_indicators = dict(indicators or {})
-            self._refresh_layout()
+            self._refresh_pending = True
 
     def update_schedule_info(self, label: Optional[str], next_text: Optional[str]):
         with self.lock:
@@ -507,26 +591,26 @@ class PerformanceDisplay:
                     self._schedule_next_dt = datetime.now()
             except Exception:
                 self._schedule_next_dt = None
-            self._refresh_layout()
+            self._refresh_pending = True
 
     def add_message(self, message: str, level: str = "info"):
         with self.lock:
             if message:
                 self.messages.append((message, level))
-                self._refresh_layout()
+                self._refresh_pending = True
 
     def show_alert(self, message: str, alert_type: str = "info", persist: bool = False, duration: float = 3.0):
         with self.lock:
             self.alert_message = message
             self.alert_type = alert_type
-            self._refresh_layout()
+            self._refresh_pending = True
             if not persist:
                 # Auto-clear after duration seconds
                 def clear():
                     time.sleep(duration)
                     with self.lock:
                         self.alert_message = None
-                        self._refresh_layout()
+                        self._refresh_pending = True
                 threading.Thread(target=clear, daemon=True).start()
 
     def show_status(self, message: str):
@@ -538,11 +622,14 @@ class PerformanceDisplay:
         self._is_running = True
         
         # Initial render of all components
-        self._refresh_layout()
+        with self.lock:
+            self._refresh_pending = False
+            self._refresh_layout()
         
         # Start the live display
         self._live = Live(
             self.layout, 
+            console=self.console,
             refresh_per_second=4, 
             screen=True,
             redirect_stdout=False,
@@ -555,6 +642,7 @@ class PerformanceDisplay:
             # Main update loop
             while self._is_running and not self._should_stop:
                 self._update_display()
+                self._flush_pending_refresh()
                 time.sleep(0.1)  # More responsive to input
         except Exception as e:
             try:
@@ -581,6 +669,18 @@ class PerformanceDisplay:
             self._live.__exit__(None, None, None)
             self._live = None
 
+    def _flush_pending_refresh(self):
+        """Render once for all updates requested since the last frame.
+
+        Rendering happens on the display thread so scraper workers calling
+        update_* only pay for a state change, not for rebuilding the layout.
+        """
+        with self.lock:
+            if not self._refresh_pending:
+                return
+            self._refresh_pending = False
+            self._refresh_layout()
+
     def _update_display(self):
         """Handle keyboard input and update the display."""
         if not hasattr(self, '_live') or self._live is None:
@@ -628,14 +728,14 @@ class PerformanceDisplay:
             # Handle key presses
             if key == 'up':
                 self._selected_control = (self._selected_control - 1) % len(self._controls)
-                self._refresh_layout()
+                self._refresh_pending = True
             elif key == 'down':
                 self._selected_control = (self._selected_control + 1) % len(self._controls)
-                self._refresh_layout()
+                self._refresh_pending = True
             elif key == 'enter':
                 _, action = self._controls[self._selected_control]
                 action()
-                self._refresh_layout()
+                self._refresh_pending = True
                 
         except KeyboardInterrupt:
             self.show_alert("Stopping (Ctrl+C)...", "error")
@@ -646,9 +746,9 @@ class PerformanceDisplay:
             # Ensure the schedule countdown stays live by refreshing roughly once per second
             try:
                 if self._schedule_next_dt is not None:
-                    now_ts = time.time()
-                    if now_ts - self._last_schedule_refresh_ts >= 1.0:
-                        self._last_schedule_refresh_ts = now_ts
-                        self._refresh_layout()
+                    now_ns = time.monotonic_ns()
+                    if now_ns - self._last_schedule_refresh_ns >= 1_000_000_000:
+                        self._last_schedule_refresh_ns = now_ns
+                        self._refresh_pending = True
             except Exception:
                 pass
\ No newline at end of file
@@ -27,6 +27,13 @@ class NetworkError(FlashscoreScraperError):
     """Raised for network-related errors (timeouts, disconnections, etc)."""
     pass
 
+class RetryCancelledError(FlashscoreScraperError, RuntimeError):
+    """Raised when a pending retry is aborted by RetryManager.cancel().
+
+    Subclasses RuntimeError so existing "cancelled by shutdown" handlers keep working.
+    """
+    pass
+
 class DriverError(FlashscoreScraperError):
     """Raised for browser/driver issues (installation, launch, crash, etc)."""
     pass
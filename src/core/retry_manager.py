@@ -1,12 +1,13 @@
 import sys
 import os
 import contextlib
-import time
 import random
 import logging
-from typing import Callable, Any, Optional, Type, Tuple
+import threading
+from typing import Callable, Any, Optional, Type, Tuple, List
 from functools import wraps
 from selenium.common.exceptions import WebDriverException
+from src.core.exceptions import RetryCancelledError
 
 @contextlib.contextmanager
 def suppress_stderr():
@@ -18,6 +19,12 @@ def suppress_stderr():
         finally:
             sys.stderr = old_stderr
 
+def _exception_tuple(exceptions) -> Tuple[Type[BaseException], ...]:
+    """Normalize an exception class or an iterable of them to a tuple."""
+    if isinstance(exceptions, type):
+        return (exceptions,)
+    return tuple(exceptions)
+
 class RetryManager:
     """
     Handles retry logic with exponential backoff and jitter.
@@ -45,6 +52,34 @@ class RetryManager:
         self.exponential_base = exponential_base
         self.jitter_factor = jitter_factor
         self.logger = logging.getLogger(__name__)
+        # Set by cancel(); wakes any backoff wait immediately
+        self._stop_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """
+        Abort pending and future retry waits on this manager until reset().
+        
+        Any thread currently waiting out a backoff delay wakes immediately and
+        raises RetryCancelledError instead of sleeping for the full delay.
+        """
+        self._stop_event.set()
+    
+    def reset(self) -> None:
+        """Re-arm the manager after cancel() so a new run can retry again."""
+        self._stop_event.clear()
+    
+    def _wait(self, delay: float) -> None:
+        """Wait out a backoff delay, raising RetryCancelledError if cancelled."""
+        if self._stop_event.wait(delay):
+            raise RetryCancelledError("Operation cancelled by shutdown")
+    
+    def _jittered(self, delay: float) -> float:
+        """Cap a raw backoff delay at max_delay and apply jitter."""
+        delay = min(delay, self.max_delay)
+        
+        # Add jitter to prevent thundering herd
+        jitter = delay * self.jitter_factor * random.uniform(-1, 1)
+        return max(0, delay + jitter)
     
     def calculate_delay(self, attempt: int) -> float:
         """
@@ -57,16 +92,28 @@ class RetryManager:
             Delay in seconds
         """
         # Exponential backoff: base_delay * (exponential_base ^ attempt)
-        delay = self.base_delay * (self.exponential_base ** attempt)
-        
-        # Cap at max_delay
-        delay = min(delay, self.max_delay)
+        return self._jittered(self.base_delay * (self.exponential_base ** attempt))
+    
+    def calculate_delays(self, count: int) -> List[float]:
+        """
+        Calculate the delays for ``count`` consecutive retries in one pass.
         
-        # Add jitter to prevent thundering herd
-        jitter = delay * self.jitter_factor * random.uniform(-1, 1)
-        delay += jitter
+        Equivalent to calling calculate_delay(0) .. calculate_delay(count - 1),
+        but the exponential term is advanced by one multiplication per step
+        instead of recomputing the power for every attempt.
         
-        return max(0, delay)
+        Args:
+            count: Number of delays to compute
+            
+        Returns:
+            List of delays in seconds
+        """
+        delays = []
+        delay = self.base_delay
+        for _ in range(count):
+            delays.append(self._jittered(delay))
+            delay *= self.exponential_base
+        return delays
     
     def retry_operation(self, 
                        operation: Callable,
@@ -89,6 +136,10 @@ class RetryManager:
             Last exception if all retries fail
         """
         last_exception = None
+        # Accept a single class or any iterable of classes, not just a tuple
+        retryable = _exception_tuple(retryable_exceptions)
+        # Backoff schedule, computed once on the first failure
+        delays = None
         
         for attempt in range(self.max_attempts):
             try:
@@ -97,16 +148,18 @@ class RetryManager:
                     self.logger.info(f"Operation succeeded on attempt {attempt + 1}")
                 return result
                 
-            except retryable_exceptions as e:
+            except retryable as e:
                 last_exception = e
                 
                 if attempt < self.max_attempts - 1:
-                    delay = self.calculate_delay(attempt)
+                    if delays is None:
+                        delays = self.calculate_delays(self.max_attempts - 1)
+                    delay = delays[attempt]
                     self.logger.warning(
                         f"Operation failed on attempt {attempt + 1}/{self.max_attempts}: {e}. "
                         f"Retrying in {delay:.2f}s..."
                     )
-                    time.sleep(delay)
+                    self._wait(delay)
                 else:
                     self.logger.error(
                         f"Operation failed after {self.max_attempts} attempts. "
@@ -125,13 +178,15 @@ class RetryManager:
             max_attempts: Override default max_attempts
             retryable_exceptions: Exceptions that should trigger retry
         """
+        exc_tuple = _exception_tuple(retryable_exceptions)
+
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs):
                 attempts = max_attempts if max_attempts is not None else self.max_attempts
                 return self.retry_operation(
                     func, *args, 
-                    retryable_exceptions=retryable_exceptions,
+                    retryable_exceptions=exc_tuple,
                     **kwargs
                 )
             return wrapper
@@ -192,6 +247,14 @@ class NetworkRetryManager(RetryManager):
         
         monitor = NetworkMonitor()
         last_exception = None
+        # Backoff schedule, computed once on the first failure
+        schedule: List[float] = []
+
+        def _backoff(attempt: int) -> float:
+            if not schedule:
+                schedule.extend(self.calculate_delays(self.max_attempts - 1))
+            return schedule[attempt]
+
         for attempt in range(self.max_attempts):
             # Cooperative cancellation check
             if _is_shutting_down():
@@ -225,7 +288,7 @@ class NetworkRetryManager(RetryManager):
                     if not _is_shutting_down():
                         self.logger.warning(f"Selenium network error: {msg}. Will wait for reconnection and retry.")
                     if attempt < self.max_attempts - 1:
-                        delay = self.calculate_delay(attempt)
+                        delay = _backoff(attempt)
                         # Cooperative cancellation before sleeping
                         if _is_shutting_down() or (callable(stop_checker) and stop_checker()):
                             raise RuntimeError("Operation cancelled by shutdown")
@@ -234,7 +297,7 @@ class NetworkRetryManager(RetryManager):
                                 f"Operation failed on attempt {attempt + 1}/{self.max_attempts}: {msg}. "
                                 f"Retrying in {delay:.2f}s..."
                             )
-                        time.sleep(delay)
+                        self._wait(delay)
                         continue
                 if attempt >= self.max_attempts - 1:
                     if not _is_shutting_down():
@@ -244,7 +307,7 @@ class NetworkRetryManager(RetryManager):
                         )
                     raise
                 else:
-                    delay = self.calculate_delay(attempt)
+                    delay = _backoff(attempt)
                     if _is_shutting_down() or (callable(stop_checker) and stop_checker()):
                         raise RuntimeError("Operation cancelled by shutdown")
                     if not _is_shutting_down():
@@ -252,14 +315,14 @@ class NetworkRetryManager(RetryManager):
                             f"Operation failed on attempt {attempt + 1}/{self.max_attempts}: {e}. "
                             f"Retrying in {delay:.2f}s..."
                         )
-                    time.sleep(delay)
+                    self._wait(delay)
             except Exception as e:
                 last_exception = e
                 if self._is_network_error(e):
                     if not _is_shutting_down():
                         self.logger.warning(f"Network error detected: {str(e)}. Will wait for reconnection and retry.")
                     if attempt < self.max_attempts - 1:
-                        delay = self.calculate_delay(attempt)
+                        delay = _backoff(attempt)
                         if _is_shutting_down() or (callable(stop_checker) and stop_checker()):
                             raise RuntimeError("Operation cancelled by shutdown")
                         if not _is_shutting_down():
@@ -267,7 +330,7 @@ class NetworkRetryManager(RetryManager):
                                 f"Operation failed on attempt {attempt + 1}/{self.max_attempts}: {str(e)}. "
                                 f"Retrying in {delay:.2f}s..."
                             )
-                        time.sleep(delay)
+                        self._wait(delay)
                         continue
                 if attempt >= self.max_attempts - 1:
                     if not _is_shutting_down():
@@ -277,7 +340,7 @@ class NetworkRetryManager(RetryManager):
                         )
                     raise
                 else:
-                    delay = self.calculate_delay(attempt)
+                    delay = _backoff(attempt)
                     if _is_shutting_down() or (callable(stop_checker) and stop_checker()):
                         raise RuntimeError("Operation cancelled by shutdown")
                     if not _is_shutting_down():
@@ -285,7 +348,7 @@ class NetworkRetryManager(RetryManager):
                             f"Operation failed on attempt {attempt + 1}/{self.max_attempts}: {e}. "
                             f"Retrying in {delay:.2f}s..."
                         )
-                    time.sleep(delay)
+                    self._wait(delay)
         if last_exception is not None:
             raise last_exception
         else:
@@ -6,7 +6,8 @@ with the canonical Flashscore structure. Minimal `?mid=...` URLs are not used.
 """
 
 from urllib.parse import urlparse, parse_qs
-from typing import Dict, Optional, TypedDict, Literal, overload, Union
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, TypedDict, Literal, overload, Union
 import re
 import logging
 from selenium.webdriver.common.by import By
@@ -48,8 +49,23 @@ class UrlBuilder:
     """
 
     BASE_DOMAIN = "https://www.flashscore.co.ke/match"
+    MATCH_FIELDS = ("mid", "home_slug", "home_id", "away_slug", "away_id")
+    # Path segment for each URL type, relative to the match base URL
+    PATHS: Dict[str, str] = {
+        "summary": "summary/",
+        "home_away_odds": "odds/home-away/ft-including-ot/",
+        "over_under_odds": "odds/over-under/ft-including-ot/",
+        "h2h": "h2h/overall/",
+    }
     VALID_ID = re.compile(r"^[A-Za-z0-9]+$")
     VALID_SLUG = re.compile(r"^[a-z0-9-]+$")
+    # Canonical summary URLs, as emitted by the site and by this builder.
+    # Slug and id split on the last hyphen, matching rsplit("-", 1) below.
+    CANONICAL_URL = re.compile(
+        r"^https?://[^/?#]*flashscore[^/?#]*/match/basketball/"
+        r"([^/?#]+)-([^/?#-]+)/([^/?#]+)-([^/?#-]+)(?:/[^?#]*)?"
+        r"\?mid=([A-Za-z0-9]+)$"
+    )
 
     def __init__(
         self,
@@ -64,11 +80,26 @@ class UrlBuilder:
         self.home_id = home_id
         self.away_slug = away_slug
         self.away_id = away_id
+        # URLs built from the components they were last validated against
+        self._urls_key: Optional[tuple] = None
+        self._urls: Dict[str, str] = {}
 
     # ---------- Parsing ----------
     @classmethod
     def parse_summary_url(cls, url: str) -> MatchData:
         """Parse a Flashscore summary URL into its components."""
+        # Fresh dict per call; the cached tuple underneath stays immutable
+        return dict(zip(cls.MATCH_FIELDS, cls._parse_components(url)))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_components(url: str) -> Tuple[str, str, str, str, str]:
+        """Parse a summary URL into MATCH_FIELDS order; memoized per URL."""
+        # Fast path: one regex match covers the canonical form
+        m = UrlBuilder.CANONICAL_URL.match(url)
+        if m:
+            return m.group(5), m.group(1), m.group(2), m.group(3), m.group(4)
+
         parsed = urlparse(url)
         if not parsed.netloc or "flashscore" not in parsed.netloc:
             raise ValueError("Not a Flashscore URL")
@@ -98,13 +129,7 @@ class UrlBuilder:
         except ValueError:
             raise ValueError("Malformed Flashscore match URL")
 
-        return {
-            "mid": mid,
-            "home_slug": home_slug,
-            "home_id": home_id,
-            "away_slug": away_slug,
-            "away_id": away_id,
-        }
+        return mid, home_slug, home_id, away_slug, away_id
 
     @classmethod
     def from_element(cls, element: WebElement) -> "UrlBuilder":
@@ -242,29 +267,31 @@ class UrlBuilder:
             f"{self.home_slug}-{self.home_id}/{self.away_slug}-{self.away_id}"
         )
 
-    def _build_url(self, path: str) -> str:
-        self._validate()
-        return f"{self._base_url()}/{path}?mid={self.mid}"
+    def _build_urls(self) -> Dict[str, str]:
+        """Validate and build every URL once; rebuilt only if a component changes."""
+        key = (self.mid, self.home_slug, self.home_id, self.away_slug, self.away_id)
+        if key != self._urls_key:
+            self._validate()
+            base = self._base_url()
+            query = f"?mid={self.mid}"
+            self._urls = {name: f"{base}/{path}{query}" for name, path in self.PATHS.items()}
+            self._urls_key = key
+        return self._urls
 
     def summary(self) -> str:
-        return self._build_url("summary/")
+        return self._build_urls()["summary"]
 
     def home_away_odds(self) -> str:
-        return self._build_url("odds/home-away/ft-including-ot/")
+        return self._build_urls()["home_away_odds"]
 
     def over_under_odds(self) -> str:
-        return self._build_url("odds/over-under/ft-including-ot/")
+        return self._build_urls()["over_under_odds"]
 
     def h2h(self) -> str:
-        return self._build_url("h2h/overall/")
+        return self._build_urls()["h2h"]
 
     def get_urls(self) -> Dict[str, str]:
-        return {
-            "summary": self.summary(),
-            "home_away_odds": self.home_away_odds(),
-            "over_under_odds": self.over_under_odds(),
-            "h2h": self.h2h(),
-        }
+        return dict(self._build_urls())
 
     @overload
     def get(self, url_type: Literal["summary"]) -> str: ...
@@ -298,7 +325,7 @@ class UrlBuilder:
         ...
 
     def get(self, url_type: UrlType) -> str:
-        urls = self.get_urls()
+        urls = self._build_urls()
         if url_type not in urls:
             raise ValueError(f"Unknown URL type: {url_type}")
         return urls[url_type]
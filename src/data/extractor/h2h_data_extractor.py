@@ -3,6 +3,7 @@ from src.data.elements_model import H2HElements
 from src.utils.utils import format_date
 from src.data.verifier.h2h_data_verifier import H2HDataVerifier
 from src.utils.config_loader import MIN_H2H_MATCHES
+from src.utils.selenium_utils import SeleniumUtils
 from src.core.exceptions import DataNotFoundError, DataParseError, DataValidationError, DataUnavailableWarning
 import logging
 
@@ -60,6 +61,39 @@ class H2HDataExtractor:
         el = row.get('away_score')
         return el.text.strip() if el and hasattr(el, 'text') else None
 
+    # Field order of each row returned by _batch_row_texts
+    _ROW_FIELDS = ('date', 'home_team', 'away_team', 'home_score', 'away_score', 'competition')
+
+    def _batch_row_texts(self, rows) -> Optional[List[List[Optional[str]]]]:
+        """Read every row's field texts with one WebDriver call.
+
+        Returns per-row [date, home_team, away_team, home_score, away_score,
+        competition] texts, or None when batching is unavailable so callers
+        fall back to reading each element.
+        """
+        selenium_utils = getattr(self._loader, 'selenium_utils', None)
+        if not rows or not isinstance(selenium_utils, SeleniumUtils):
+            return None
+        try:
+            targets = []
+            for row in rows:
+                competition = (self._loader.get_competition(row) if hasattr(self._loader, 'get_competition')
+                               else row.get('competition'))
+                targets.extend([
+                    self._loader.get_date(row),
+                    self._loader.get_home_team(row),
+                    self._loader.get_away_team(row),
+                    row.get('home_score'),
+                    row.get('away_score'),
+                    competition,
+                ])
+            texts = [t.strip() if isinstance(t, str) else None for t in selenium_utils.batch_text(targets)]
+        except Exception as e:
+            logger.debug(f"Batched H2H text read failed: {e}")
+            return None
+        width = len(self._ROW_FIELDS)
+        return [texts[i:i + width] for i in range(0, len(texts), width)]
+
     def extract_h2h_data(self, elements: Optional[H2HElements] = None, status_callback=None) -> List[Dict[str, Optional[str]]]:
         try:
             if status_callback:
@@ -75,18 +109,23 @@ class H2HDataExtractor:
                 if status_callback:
                     status_callback(f"Processing {len(elements.h2h_rows)} H2H matches...")
                 
-                for row in elements.h2h_rows[:MIN_H2H_MATCHES]:
+                rows = elements.h2h_rows[:MIN_H2H_MATCHES]
+                batched = self._batch_row_texts(rows)
+                for index, row in enumerate(rows):
                     try:
                         if status_callback:
                             status_callback("Extracting H2H match details...")
                         
-                        date = self._extract_date(row)
+                        if batched is not None:
+                            date, home_team, away_team, home_score, away_score, competition = batched[index]
+                        else:
+                            date = self._extract_date(row)
+                            home_team = self._extract_home_team(row)
+                            away_team = self._extract_away_team(row)
+                            home_score = self._extract_home_score(row)
+                            away_score = self._extract_away_score(row)
+                            competition = self._extract_competition(row)
                         date = format_date(date)
-                        home_team = self._extract_home_team(row)
-                        away_team = self._extract_away_team(row)
-                        home_score = self._extract_home_score(row)
-                        away_score = self._extract_away_score(row)
-                        competition = self._extract_competition(row)
                         
                         # Verify compulsory fields (all except competition)
                         for field_name, value in [
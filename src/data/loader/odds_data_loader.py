@@ -14,6 +14,7 @@ from src.data.verifier.odds_data_verifier import OddsDataVerifier
 import logging
 from src.core.exceptions import DataNotFoundError, DataParseError, DataValidationError, DataUnavailableWarning
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ class OddsDataLoader:
                     if 'wclOddsCell--empty' in parent_classes:
                         logger.debug(f"Found selected total line: {alternative.text}")
                         return alternative
-                except:
+                except WebDriverException:
                     # If we can't check parent, continue to next
                     pass
                 
@@ -2,25 +2,28 @@ from typing import Optional
 import time
 from tqdm import tqdm
 
+_BAR_FORMAT = '{l_bar}{bar}| {n_fmt}/{total_fmt} [{rate_fmt}, ETA: {remaining}]'
+
+# tqdm options shared by every download bar
+_TQDM_KW = {
+    'unit': 'B',
+    'unit_scale': True,
+    'unit_divisor': 1024,
+    'bar_format': _BAR_FORMAT,
+    'miniters': 1,
+}
+
 class DownloadProgress:
     """Visual progress tracking for downloads using tqdm"""
     
     def __init__(self):
         self.pbar: Optional[tqdm] = None
-        self.start_time: float = 0.0
+        self.start_time_ns: int = 0
         
     def init(self, total_size: int, desc: str) -> None:
         """Initialize progress bar with ETA calculation"""
-        self.start_time = time.time()
-        self.pbar = tqdm(
-            total=total_size,
-            unit='B',
-            unit_scale=True,
-            unit_divisor=1024,
-            desc=desc,
-            bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{rate_fmt}, ETA: {remaining}]',
-            miniters=1
-        )
+        self.start_time_ns = time.perf_counter_ns()
+        self.pbar = tqdm(total=total_size, desc=desc, **_TQDM_KW)
         
     def update(self, chunk_size: int) -> None:
         """Update progress with downloaded chunk"""
@@ -93,6 +93,10 @@ def _get_results_config():
     return defaults
 
 class FlashscoreScraper:
+    # For scheduled matches: home/away odds are optional, over/under odds are compulsory
+    OPTIONAL_ODDS_FIELDS = ('home_odds', 'away_odds')
+    REQUIRED_ODDS_FIELDS = ('match_total', 'over_odds', 'under_odds')
+
     def __init__(
         self,
         status_callback=None,
@@ -125,6 +129,14 @@ class FlashscoreScraper:
         self.status_callback = status_callback
         self.progress_callback = progress_callback
         
+    def cancel_retries(self) -> None:
+        """Wake any retry backoff in progress so a stop takes effect immediately."""
+        for owner in (self, self.match_loader, self.odds_loader, self.home_away_loader,
+                      self.over_under_loader, self.h2h_loader):
+            manager = getattr(owner, 'retry_manager', None)
+            if manager is not None:
+                manager.cancel()
+
     def has_active_driver(self) -> bool:
         """Check if there's an active driver without creating a new one."""
         return getattr(self, "_driver", None) is not None
@@ -178,6 +190,11 @@ class FlashscoreScraper:
         if status_callback is None:
             status_callback = self.status_callback
 
+        # A previous close()/stop cancelled the retry manager; re-arm it for
+        # this run, like the per-run _is_shutting_down clear in api/state.py
+        if self.retry_manager is not None:
+            self.retry_manager.reset()
+
         try:
             self.reporter.status("Launching browser and initializing driver...")
 
@@ -491,21 +508,10 @@ class FlashscoreScraper:
         return h2h_matches, self.h2h_loader.get_h2h_count()
 
     def validate_odds_data(self, odds):
-        missing_odds_fields = []
-        # For scheduled matches: home/away odds are optional, over/under odds are compulsory
-        if odds.home_odds is None:
-            logger.warning("Missing home_odds - 1X2 odds unavailable")
-        if odds.away_odds is None:
-            logger.warning("Missing away_odds - 1X2 odds unavailable")
-        
-        # Over/under odds are compulsory for scheduled matches
-        if odds.match_total is None:
-            missing_odds_fields.append('match_total')
-        if odds.over_odds is None:
-            missing_odds_fields.append('over_odds')
-        if odds.under_odds is None:
-            missing_odds_fields.append('under_odds')
-        
+        for field in self.OPTIONAL_ODDS_FIELDS:
+            if getattr(odds, field) is None:
+                logger.warning(f"Missing {field} - 1X2 odds unavailable")
+        missing_odds_fields = [field for field in self.REQUIRED_ODDS_FIELDS if getattr(odds, field) is None]
         return bool(missing_odds_fields), missing_odds_fields
 
     def compose_skip_reason(self, odds_incomplete, missing_odds_fields, h2h_count):
@@ -586,6 +592,10 @@ class FlashscoreScraper:
             # Mark scraper as closing to prevent new operations
             self._is_closing = True
             
+            # Wake retries sleeping out a backoff on other threads; the
+            # thread flag above only reaches the thread calling close()
+            self.cancel_retries()
+            
             # Stop network monitoring with suppressed logs
             if hasattr(self, 'network_monitor') and self.network_monitor is not None:
                 try:
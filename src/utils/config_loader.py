@@ -3,10 +3,13 @@ Configuration loader for the Flashscore Scraper.
 Loads configuration from config.json and provides easy access to settings.
 """
 import json
+import logging
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
 # Default configuration
 DEFAULT_CONFIG = {
     'browser': {
@@ -67,7 +70,7 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
                 # Validate selectors and add defaults for missing ones
                 return validate_selectors(merged_config)
     except Exception as e:
-        print(f"Warning: Could not load config from {config_path}: {e}")
+        logger.warning("Could not load config from %s: %s", config_path, e)
     
     # Return validated default config
     return validate_selectors(DEFAULT_CONFIG.copy())
@@ -92,7 +95,7 @@ def save_config(config: Dict[str, Any], config_path: str = None) -> bool:
             json.dump(config, f, indent=4)
         return True
     except Exception as e:
-        print(f"Error saving config to {config_path}: {e}")
+        logger.error("Error saving config to %s: %s", config_path, e)
         return False
 
 def _deep_merge(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
@@ -2,7 +2,7 @@ from typing import List, Optional, Union, Tuple, Any, Dict
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
 import time
@@ -91,7 +91,7 @@ class SeleniumUtils:
                 try:
                     self.driver.execute_script("arguments[0].style.display = 'none';", element)
                     hidden_count += 1
-                except:
+                except WebDriverException:
                     continue
             
             if duration is None or time.time() - start_time >= duration:
@@ -571,6 +571,45 @@ class SeleniumUtils:
             self.logger.debug(f"Error checking for tab '{tab_name}': {e}")
             return False 
 
+    MATCH_DATE_SELECTOR = '.fixedScore__status'
+    MATCH_STATUS_SELECTOR = '.detailScore__status .fixedHeaderDuel__detailStatus'
+    # Text of each target (a CSS selector's first match or an element), null if absent
+    _TEXTS_SCRIPT = """
+        return Array.prototype.map.call(arguments, function (target) {
+            var el = typeof target === 'string' ? document.querySelector(target) : target;
+            return el ? el.innerText : null;
+        });
+    """
+
+    def batch_text(self, targets: List[Union[str, WebElement, None]]) -> List[Optional[str]]:
+        """Read the text of several elements in a single WebDriver round-trip.
+
+        Args:
+            targets: CSS selectors (first match is used) or WebElements; None
+                entries are allowed and yield None
+
+        Returns:
+            List[Optional[str]]: Text per target, None where nothing was found
+        """
+        if not targets:
+            return []
+        try:
+            texts = self.driver.execute_script(self._TEXTS_SCRIPT, *targets)
+            if isinstance(texts, list) and len(texts) == len(targets):
+                return texts
+        except Exception as e:
+            self.logger.debug(f"Batched text read failed, falling back to per-element reads: {e}")
+        texts = []
+        for target in targets:
+            elem = self.find('css', target) if isinstance(target, str) else target
+            texts.append(elem.text if elem is not None and hasattr(elem, 'text') else None)
+        return texts
+
+    def _match_status_texts(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return the (date, status) texts of the match header in one round-trip."""
+        date_text, status_text = self.batch_text([self.MATCH_DATE_SELECTOR, self.MATCH_STATUS_SELECTOR])
+        return date_text, status_text
+
     def get_match_status(self) -> str:
         """
         Extract the match status from the loaded match page.
@@ -578,19 +617,16 @@ class SeleniumUtils:
             str: 'scheduled', 'live', or 'finished'
         """
         try:
-            # First, try to find a date/time in the fixedScore__status (scheduled matches)
-            # This is more efficient for scheduled matches and avoids score element queries
-            date_elem = self.find('css', '.fixedScore__status')
-            if date_elem and hasattr(date_elem, 'text'):
-                date_text = date_elem.text.strip()
+            date_text, status_text = self._match_status_texts()
+            # A date/time in fixedScore__status means the match is scheduled
+            if date_text is not None:
+                date_text = date_text.strip()
                 if date_text and any(char.isdigit() for char in date_text):
                     return 'scheduled'
             
-            # If no date found, try to find the status span (live or finished)
-            # Only query score elements if we haven't found a scheduled match
-            status_elem = self.find('css', '.detailScore__status .fixedHeaderDuel__detailStatus')
-            if status_elem and hasattr(status_elem, 'text'):
-                status_text = status_elem.text.strip()
+            # Otherwise the status span tells live from finished
+            if status_text is not None:
+                status_text = status_text.strip()
                 # If status_text is empty or just a date/time, it's scheduled
                 if not status_text or status_text == '\xa0':
                     return 'scheduled'
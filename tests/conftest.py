@@ -0,0 +1,27 @@
+"""Shared pytest fixtures for the test suite."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project root importable once for every test module
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from tests.fakes import FakeDriverManager, MemoryStorage
+
+
+@pytest.fixture
+def scraper():
+    """A FlashscoreScraper wired to in-memory fakes, built fresh for each test."""
+    # Imported here so modules that never ask for a scraper don't load its stack
+    from src.reporting import NullReporter
+    from src.scraper import FlashscoreScraper
+
+    return FlashscoreScraper(
+        reporter=NullReporter(),
+        driver_factory=FakeDriverManager,
+        storage=MemoryStorage(),
+        config_snapshot={},
+    )
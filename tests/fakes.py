@@ -0,0 +1,36 @@
+"""In-memory stand-ins for the scraper's driver and storage dependencies."""
+from typing import Optional
+
+
+class FakeDriver:
+    current_url = "about:blank"
+    def quit(self):
+        pass
+    def implicitly_wait(self, t):
+        pass
+
+
+class FakeDriverManager:
+    def __init__(self):
+        self._driver = FakeDriver()
+        self.chrome_log_path: Optional[str] = None
+    def initialize(self) -> None:
+        pass
+    def get_driver(self):
+        return self._driver
+    def close(self, force: bool = False) -> None:
+        pass
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.saved = {}
+    def save_matches(self, matches, filename: Optional[str] = None) -> bool:
+        self.saved[filename or "matches.json"] = [m.to_dict() for m in matches]
+        return True
+    def save_results(self, results, filename: Optional[str] = None) -> bool:
+        self.saved[filename or "results.json"] = results
+        return True
+    def load_matches(self, filename):
+        # Return empty for simplicity
+        return []
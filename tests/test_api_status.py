@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+from api.routers import status
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    """Point the outputs endpoints at an empty temporary project root."""
+    monkeypatch.setattr(status, "PROJECT_ROOT", tmp_path)
+    status._render_output.cache_clear()
+    json_dir = tmp_path / "output" / "json"
+    json_dir.mkdir(parents=True)
+    return json_dir
+
+
+def _write(path, data, mtime_ns):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_get_output_returns_file_json(output_dir):
+    _write(output_dir / "matches_010125.json", {"matches": [{"match_id": "a"}]}, 1_000_000_000)
+
+    response = status.get_output("matches_010125.json")
+
+    assert json.loads(response.body) == {"matches": [{"match_id": "a"}]}
+    assert response.media_type == "application/json"
+
+
+def test_get_output_rereads_rewritten_file(output_dir):
+    path = output_dir / "matches_010125.json"
+    _write(path, {"matches": [{"match_id": "a"}]}, 1_000_000_000)
+    status.get_output("matches_010125.json")
+
+    _write(path, {"matches": [{"match_id": "b"}]}, 2_000_000_000)
+
+    assert json.loads(status.get_output("matches_010125.json").body) == {"matches": [{"match_id": "b"}]}
+
+
+def test_get_output_invalid_json_is_500(output_dir):
+    (output_dir / "broken.json").write_text("{bad", encoding="utf-8")
+
+    with pytest.raises(status.HTTPException) as exc:
+        status.get_output("broken.json")
+    assert exc.value.status_code == 500
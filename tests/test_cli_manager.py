@@ -1,14 +1,18 @@
+import os
 import unittest
 from unittest.mock import patch, MagicMock
 from src.cli.cli_manager import CLIManager
 
 class TestCLIManager(unittest.TestCase):
-    @patch('os.system')
-    def test_clear_terminal(self, mock_system):
+    def test_clear_terminal(self):
         cli = CLIManager()
-        cli.clear_terminal()
-        mock_system.assert_called_once()
-        self.assertIn(mock_system.call_args[0][0], ['cls', 'clear'])
+        with patch('os.system') as mock_system, patch('sys.stdout') as mock_stdout:
+            cli.clear_terminal()
+        if os.name == 'nt':
+            mock_system.assert_called_once_with('cls')
+        else:
+            mock_system.assert_not_called()
+            mock_stdout.write.assert_called_once_with("\033[2J\033[H")
 
     def test_display_header(self):
         cli = CLIManager()
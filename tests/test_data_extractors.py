@@ -3,17 +3,13 @@
 Tests for data extractors
 """
 
-import sys
-import os
 import pytest
 from unittest.mock import Mock
 
-# Add the project root to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from src.data.extractor.match_data_extractor import MatchDataExtractor
 from src.data.extractor.h2h_data_extractor import H2HDataExtractor
 from src.data.elements_model import MatchElements, H2HElements
+from src.utils.selenium_utils import SeleniumUtils
 from src.core.exceptions import DataNotFoundError, DataParseError, DataValidationError
 
 
@@ -533,6 +529,24 @@ class TestH2HDataExtractor:
             # If no exception, check for empty result
             assert len(result) == 0
 
+    def test_extract_h2h_data_reads_rows_in_one_batch(self, h2h_extractor, mock_h2h_loader):
+        """Test that all H2H row texts are read with a single batch_text call"""
+        selenium_utils = Mock(spec=SeleniumUtils)
+        selenium_utils.batch_text.return_value = [
+            '01.01.23', 'Team A', 'Team B', '85', '80', 'League1',
+            '02.01.23', 'Team B', 'Team A', '90', '88', None,
+        ]
+        mock_h2h_loader.selenium_utils = selenium_utils
+        mock_h2h_loader.elements.h2h_rows = [{}, {}]
+
+        result = h2h_extractor.extract_h2h_data()
+
+        selenium_utils.batch_text.assert_called_once()
+        assert len(selenium_utils.batch_text.call_args[0][0]) == 12
+        assert [r['home_team'] for r in result] == ['Team A', 'Team B']
+        assert result[0]['home_score'] == '85'
+        assert result[1]['competition'] is None
+
 
 class TestDataExtractorsIntegration:
     """Integration tests for data extractors"""
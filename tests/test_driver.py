@@ -1,12 +1,10 @@
 #!/usr/bin/env python3
 """Test script to verify cross-platform WebDriver configuration."""
 
-import sys
 import os
 import platform
 import pytest
 from unittest.mock import patch, Mock, MagicMock
-sys.path.append('.')
 
 from src.driver_manager import WebDriverManager
 from src.utils.config_loader import CONFIG
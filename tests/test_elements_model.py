@@ -3,14 +3,9 @@
 Tests for elements_model.py
 """
 
-import sys
-import os
 import unittest
 from unittest.mock import Mock
 
-# Add the project root to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from src.data.elements_model import MatchElements, OddsElements, H2HElements
 
 
@@ -12,6 +12,21 @@ from src.models import MatchModel, OddsModel, H2HMatchModel
 from src.storage.json_storage import JSONStorage
 
 
+def make_match(match_id="m1", status="complete", skip_reason=None):
+    """Helper to create a test match."""
+    return MatchModel.create(
+        match_id=match_id,
+        country="USA",
+        league="NBA",
+        home_team="Lakers",
+        away_team="Celtics",
+        date="2026-06-06",
+        time="20:00",
+        status=status,
+        skip_reason=skip_reason,
+    )
+
+
 class TestJSONStorageInit(unittest.TestCase):
     """Test JSONStorage initialization."""
 
@@ -45,23 +60,9 @@ class TestSaveMatches(unittest.TestCase):
     def tearDown(self):
         shutil.rmtree(self.tmpdir, ignore_errors=True)
 
-    def _make_match(self, match_id="m1", status="complete", skip_reason=None):
-        """Helper to create a test match."""
-        return MatchModel.create(
-            match_id=match_id,
-            country="USA",
-            league="NBA",
-            home_team="Lakers",
-            away_team="Celtics",
-            date="2026-06-06",
-            time="20:00",
-            status=status,
-            skip_reason=skip_reason,
-        )
-
     def test_save_complete_match_creates_file(self):
         """Test that saving a complete match creates a JSON file."""
-        match = self._make_match()
+        match = make_match()
         result = self.storage.save_matches([match], filename="test_save.json")
         self.assertTrue(result)
         filepath = Path(self.tmpdir) / "test_save.json"
@@ -69,7 +70,7 @@ class TestSaveMatches(unittest.TestCase):
 
     def test_save_complete_match_data_structure(self):
         """Test the data structure of a saved complete match."""
-        match = self._make_match()
+        match = make_match()
         self.storage.save_matches([match], filename="test_structure.json")
         filepath = Path(self.tmpdir) / "test_structure.json"
         with open(filepath, "r", encoding="utf-8") as f:
@@ -83,7 +84,7 @@ class TestSaveMatches(unittest.TestCase):
 
     def test_save_incomplete_match_goes_to_skipped(self):
         """Test that an incomplete match goes to skipped_matches, not matches."""
-        match = self._make_match(match_id="m2", status="incomplete", skip_reason="no odds")
+        match = make_match(match_id="m2", status="incomplete", skip_reason="no odds")
         self.storage.save_matches([match], filename="test_incomplete.json")
         filepath = Path(self.tmpdir) / "test_incomplete.json"
         with open(filepath, "r", encoding="utf-8") as f:
@@ -96,8 +97,8 @@ class TestSaveMatches(unittest.TestCase):
 
     def test_save_complete_and_incomplete_together(self):
         """Test saving a mix of complete and incomplete matches."""
-        complete = self._make_match(match_id="c1", status="complete")
-        incomplete = self._make_match(match_id="i1", status="incomplete", skip_reason="no H2H")
+        complete = make_match(match_id="c1", status="complete")
+        incomplete = make_match(match_id="i1", status="incomplete", skip_reason="no H2H")
         self.storage.save_matches([complete, incomplete], filename="test_mixed.json")
         filepath = Path(self.tmpdir) / "test_mixed.json"
         with open(filepath, "r", encoding="utf-8") as f:
@@ -110,10 +111,10 @@ class TestSaveMatches(unittest.TestCase):
 
     def test_save_updates_existing_file(self):
         """Test that saving to an existing file merges data correctly."""
-        match1 = self._make_match(match_id="m1")
+        match1 = make_match(match_id="m1")
         self.storage.save_matches([match1], filename="test_update.json")
 
-        match2 = self._make_match(match_id="m2")
+        match2 = make_match(match_id="m2")
         self.storage.save_matches([match2], filename="test_update.json")
 
         filepath = Path(self.tmpdir) / "test_update.json"
@@ -125,11 +126,11 @@ class TestSaveMatches(unittest.TestCase):
 
     def test_save_overwrites_complete_match(self):
         """Test that re-saving a match with the same ID overwrites it."""
-        match_v1 = self._make_match(match_id="m1")
+        match_v1 = make_match(match_id="m1")
         match_v1.home_team = "Lakers"
         self.storage.save_matches([match_v1], filename="test_overwrite.json")
 
-        match_v2 = self._make_match(match_id="m1")
+        match_v2 = make_match(match_id="m1")
         match_v2.home_team = "Warriors"
         self.storage.save_matches([match_v2], filename="test_overwrite.json")
 
@@ -141,10 +142,10 @@ class TestSaveMatches(unittest.TestCase):
 
     def test_complete_match_removes_from_skipped(self):
         """Test that completing a previously skipped match removes it from skipped list."""
-        incomplete = self._make_match(match_id="m1", status="incomplete", skip_reason="no odds")
+        incomplete = make_match(match_id="m1", status="incomplete", skip_reason="no odds")
         self.storage.save_matches([incomplete], filename="test_promote.json")
 
-        complete = self._make_match(match_id="m1", status="complete")
+        complete = make_match(match_id="m1", status="complete")
         self.storage.save_matches([complete], filename="test_promote.json")
 
         filepath = Path(self.tmpdir) / "test_promote.json"
@@ -166,7 +167,7 @@ class TestSaveMatches(unittest.TestCase):
 
     def test_metadata_fields_populated(self):
         """Test that metadata fields are correctly populated."""
-        match = self._make_match()
+        match = make_match()
         self.storage.save_matches([match], filename="test_meta.json")
         filepath = Path(self.tmpdir) / "test_meta.json"
         with open(filepath, "r", encoding="utf-8") as f:
@@ -181,7 +182,7 @@ class TestSaveMatches(unittest.TestCase):
     def test_save_match_with_odds(self):
         """Test saving a match with odds data."""
         odds = OddsModel(match_id="m1", home_odds=1.85, away_odds=2.10, over_odds=1.90, under_odds=1.90, match_total=210.5)
-        match = self._make_match(match_id="m1")
+        match = make_match(match_id="m1")
         match.odds = odds
         self.storage.save_matches([match], filename="test_odds.json")
         filepath = Path(self.tmpdir) / "test_odds.json"
@@ -195,7 +196,7 @@ class TestSaveMatches(unittest.TestCase):
     def test_save_match_with_h2h(self):
         """Test saving a match with H2H data."""
         h2h = H2HMatchModel(match_id="m1", date="2025-12-01", home_team="Lakers", away_team="Celtics", home_score=110, away_score=105, competition="NBA")
-        match = self._make_match(match_id="m1")
+        match = make_match(match_id="m1")
         match.h2h_matches = [h2h]
         self.storage.save_matches([match], filename="test_h2h.json")
         filepath = Path(self.tmpdir) / "test_h2h.json"
@@ -217,19 +218,6 @@ class TestGetProcessedMatchIds(unittest.TestCase):
     def tearDown(self):
         shutil.rmtree(self.tmpdir, ignore_errors=True)
 
-    def _make_match(self, match_id="m1", status="complete", skip_reason=None):
-        return MatchModel.create(
-            match_id=match_id,
-            country="USA",
-            league="NBA",
-            home_team="Lakers",
-            away_team="Celtics",
-            date="2026-06-06",
-            time="20:00",
-            status=status,
-            skip_reason=skip_reason,
-        )
-
     def test_empty_file_returns_empty_set(self):
         """Test that an empty file returns an empty set."""
         result = self.storage.get_processed_match_ids(filename="nonexistent.json")
@@ -237,7 +225,7 @@ class TestGetProcessedMatchIds(unittest.TestCase):
 
     def test_returns_complete_match_ids(self):
         """Test that complete match IDs are returned."""
-        match = self._make_match(match_id="m1")
+        match = make_match(match_id="m1")
         self.storage.save_matches([match], filename="test_ids.json")
         result = self.storage.get_processed_match_ids(filename="test_ids.json")
         match_ids = {mid for mid, _ in result}
@@ -245,7 +233,7 @@ class TestGetProcessedMatchIds(unittest.TestCase):
 
     def test_returns_skipped_match_ids(self):
         """Test that skipped match IDs are returned with reasons."""
-        match = self._make_match(match_id="s1", status="incomplete", skip_reason="no odds")
+        match = make_match(match_id="s1", status="incomplete", skip_reason="no odds")
         self.storage.save_matches([match], filename="test_skipped_ids.json")
         result = self.storage.get_processed_match_ids(filename="test_skipped_ids.json")
         result_dict = dict(result)
@@ -254,8 +242,8 @@ class TestGetProcessedMatchIds(unittest.TestCase):
 
     def test_returns_both_complete_and_skipped(self):
         """Test that both complete and skipped match IDs are returned."""
-        complete = self._make_match(match_id="c1")
-        skipped = self._make_match(match_id="s1", status="incomplete", skip_reason="no H2H")
+        complete = make_match(match_id="c1")
+        skipped = make_match(match_id="s1", status="incomplete", skip_reason="no H2H")
         self.storage.save_matches([complete, skipped], filename="test_all_ids.json")
         result = self.storage.get_processed_match_ids(filename="test_all_ids.json")
         match_ids = {mid for mid, _ in result}
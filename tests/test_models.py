@@ -3,14 +3,9 @@
 Tests for data models
 """
 
-import sys
-import os
 import unittest
 from datetime import datetime
 
-# Add the project root to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from src.models import MatchModel, OddsModel, H2HMatchModel
 
 
@@ -3,14 +3,9 @@
 Tests for OddsDataExtractor class
 """
 
-import sys
-import os
 import unittest
 from unittest.mock import Mock, patch
 
-# Add the project root to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from src.data.extractor.odds_data_extractor import OddsDataExtractor
 
 
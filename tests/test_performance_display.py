@@ -5,11 +5,35 @@ This module tests the dynamic console display system that can update
 performance metrics and progress bars without affecting other console items.
 """
 
+import io
+import sys
 import time
 import threading
+from datetime import datetime
 import pytest
 from unittest.mock import patch, MagicMock
-from src.cli.performance_display import PerformanceDisplay, DisplayLine, Colors
+from rich.console import Console
+from src.cli.performance_display import PerformanceDisplay, DisplayLine, Colors, _format_metric
+
+
+@pytest.fixture
+def display():
+    """PerformanceDisplay that renders into a buffer instead of the terminal."""
+    return PerformanceDisplay(console=Console(file=io.StringIO()))
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin datetime.now() in the display module to a fixed instant."""
+    fixed = datetime(2026, 6, 7, 8, 0, 0)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fixed
+
+    monkeypatch.setattr('src.cli.performance_display.datetime', FrozenDatetime)
+    return fixed
 
 
 class TestColors:
@@ -58,9 +82,8 @@ class TestDisplayLine:
 class TestPerformanceDisplay:
     """Test cases for PerformanceDisplay."""
 
-    def test_performance_display_initialization(self):
+    def test_performance_display_initialization(self, display):
         """Test performance display initialization."""
-        display = PerformanceDisplay()
         assert hasattr(display, 'metrics')
         assert isinstance(display.metrics, dict)
         assert hasattr(display, 'lock')
@@ -69,9 +92,19 @@ class TestPerformanceDisplay:
         assert hasattr(display, '_is_running')
         assert display._is_running is True  # Created in running state; stop() sets to False
 
-    def test_update_metrics(self):
+    def test_injected_console_is_used(self):
+        """Test that output goes to the console passed at construction."""
+        console = Console(file=io.StringIO())
+        display = PerformanceDisplay(console=console)
+        assert display.console is console
+        assert display._progress.console is console
+        display._should_stop = True
+        with patch('src.cli.performance_display.Live') as live:
+            display.start()
+        assert live.call_args.kwargs['console'] is console
+
+    def test_update_metrics(self, display):
         """Test updating performance metrics."""
-        display = PerformanceDisplay()
         metrics = {
             'memory_usage': 512.5,
             'cpu_usage': 75.2,
@@ -85,116 +118,250 @@ class TestPerformanceDisplay:
         assert display.metrics['cpu_usage'] == 75.2
         assert display.metrics['active_workers'] == 4
 
-    def test_update_progress(self):
+    def test_render_metrics_formats_each_row(self, display):
+        """Test that the metrics panel formats values through the row table."""
+        display.update_metrics({
+            'memory_usage': 2048.0,
+            'cpu_usage': 85.0,
+            'active_workers': 4,
+            'success_rate': 'n/a',
+            'average_processing_time': 0.001
+        })
+        console = Console(file=io.StringIO(), width=80)
+        console.print(display._render_metrics())
+        output = console.file.getvalue()
+        assert "2.0 GB" in output
+        assert "85.0%" in output
+        assert "n/a" in output
+        assert "0.01s" in output
+        assert "--" in output  # tasks_processed was never reported
+
+    def test_metric_formatting_is_memoized(self):
+        """Test that repeated metric values are formatted once."""
+        formatter = MagicMock(return_value=("42", "bold white"))
+        assert _format_metric(formatter, 42) == ("42", "bold white")
+        assert _format_metric(formatter, 42) == ("42", "bold white")
+        formatter.assert_called_once_with(42)
+        # Unhashable values bypass the cache instead of failing
+        assert _format_metric(formatter, [1]) == ("42", "bold white")
+
+    def test_metric_labels_are_reused_between_renders(self, display):
+        """Test that metric label cells are shared across renders."""
+        first = display._render_metrics().renderable.columns[0]._cells
+        second = display._render_metrics().renderable.columns[0]._cells
+        assert first[0] is second[0] is display._metric_labels[0]
+
+    def test_update_metrics_publishes_new_snapshot(self, display):
+        """Test that metric updates never mutate a previously published dict."""
+        display.update_metrics({'cpu_usage': 10.0})
+        snapshot = display.metrics
+        display.update_metrics({'cpu_usage': 20.0})
+        assert snapshot == {'cpu_usage': 10.0}
+        assert display.metrics == {'cpu_usage': 20.0}
+
+    def test_update_progress(self, display):
         """Test updating overall progress."""
-        display = PerformanceDisplay()
         display.update_progress(50, 100, description="Overall")
         assert display.progress_current == 50
         assert display.progress_total == 100
         assert display.progress_desc == "Overall"
 
-    def test_update_batch_progress(self):
+    def test_update_batch_progress(self, display):
         """Test updating batch progress."""
-        display = PerformanceDisplay()
         display.update_batch_progress(15, 20, description="Batch")
         assert display.batch_current == 15
         assert display.batch_total == 20
         assert display.batch_desc == "Batch"
 
-    def test_update_current_task(self):
+    def test_update_current_task(self, display):
         """Test updating current task description."""
-        display = PerformanceDisplay()
         display.update_current_task("Processing match data...")
         assert display.current_task == "Processing match data..."
 
-    def test_update_current_match(self):
+    def test_update_current_match(self, display):
         """Test updating current match description."""
-        display = PerformanceDisplay()
         display.update_current_match("Lakers vs Celtics")
         assert display.current_match == "Lakers vs Celtics"
 
-    def test_show_alert(self):
+    def test_show_alert(self, display):
         """Test showing alert messages."""
-        display = PerformanceDisplay()
         display.show_alert("Test alert message", alert_type="info")
         assert display.alert_message == "Test alert message"
         assert display.alert_type == "info"
 
-    def test_show_status(self):
+    def test_show_status(self, display):
         """Test showing status messages (persistent alert)."""
-        display = PerformanceDisplay()
         display.show_status("Running...")
         assert display.alert_message == "Running..."
         assert display.alert_type == "info"
 
-    def test_update_status_indicators(self):
+    def test_update_status_indicators(self, display):
         """Test updating status indicators."""
-        display = PerformanceDisplay()
         indicators = {'network': 'green', 'driver': 'yellow', 'memory': 'red'}
         display.update_status_indicators(indicators)
         assert display.status_indicators == indicators
 
-    def test_update_schedule_info(self):
+    def test_update_schedule_info(self, display):
         """Test updating schedule information."""
-        display = PerformanceDisplay()
         display.update_schedule_info("Daily Run", "2026-06-07 09:00")
         assert display.schedule_label == "Daily Run"
         assert display.schedule_next_text == "2026-06-07 09:00"
 
-    def test_set_stop_callback(self):
+    def test_schedule_countdown(self, display, frozen_now):
+        """Test the countdown to the next run against a frozen clock."""
+        display.update_schedule_info("Daily Run", "2026-06-07 09:30")
+        assert display._schedule_countdown() == " (in 1h 30m 0s)"
+        display.update_schedule_info("Daily Run", "now")
+        assert display._schedule_countdown() == " (in 0m 0s)"
+
+    def test_set_stop_callback(self, display):
         """Test setting stop callback."""
-        display = PerformanceDisplay()
         callback = MagicMock()
         display.set_stop_callback(callback)
         assert display._stop_callback == callback
 
-    def test_add_subtask(self):
+    def test_add_subtask(self, display):
         """Test adding subtasks."""
-        display = PerformanceDisplay()
         display.add_subtask("Loading odds...")
         display.add_subtask("Extracting H2H...")
         assert len(display.subtasks) == 2
         assert "Loading odds..." in display.subtasks
         assert "Extracting H2H..." in display.subtasks
 
-    def test_clear_subtasks(self):
+    def test_clear_subtasks(self, display):
         """Test clearing subtasks."""
-        display = PerformanceDisplay()
         display.add_subtask("Task 1")
         display.add_subtask("Task 2")
         display.clear_subtasks()
         assert len(display.subtasks) == 0
 
-    def test_subtask_maxlen(self):
+    def test_subtask_maxlen(self, display):
         """Test subtask deque maxlen."""
-        display = PerformanceDisplay()
         for i in range(10):
             display.add_subtask(f"Task {i}")
         assert len(display.subtasks) == 6
         assert "Task 9" in display.subtasks
 
-    def test_reset_batch_progress(self):
+    def test_messages_are_bounded(self, display):
+        """Test that old messages are dropped once the buffer is full."""
+        for i in range(display.MAX_MESSAGES + 5):
+            display.add_message(f"Message {i}")
+        assert len(display.messages) == display.MAX_MESSAGES
+        assert display.messages[0] == ("Message 5", "info")
+        assert display.messages[-1] == (f"Message {display.MAX_MESSAGES + 4}", "info")
+
+    def test_reset_batch_progress(self, display):
         """Test resetting batch progress."""
-        display = PerformanceDisplay()
         display.update_batch_progress(10, 20, description="Old Batch")
         display.reset_batch_progress(50, description="New Batch")
         assert display.batch_total == 50
         assert display.batch_desc == "New Batch"
 
-    def test_stop_sets_flag(self):
+    def test_unchanged_regions_are_not_rerendered(self, display):
+        """Test that a region is only re-rendered when its inputs change."""
+        display.update_metrics({'active_workers': 4})
+        display._flush_pending_refresh()
+        with patch.object(display, '_render_metrics', wraps=display._render_metrics) as render:
+            display.update_metrics({'active_workers': 4})
+            display._flush_pending_refresh()
+            render.assert_not_called()
+            display.update_metrics({'active_workers': 5})
+            display._flush_pending_refresh()
+            render.assert_called_once()
+
+    def test_updates_are_coalesced_until_flush(self, display):
+        """Test that updates only mark the display dirty and render once on flush."""
+        with patch.object(display, '_refresh_layout') as refresh:
+            for i in range(10):
+                display.update_progress(i, 10)
+            refresh.assert_not_called()
+            assert display._refresh_pending is True
+            display._flush_pending_refresh()
+            display._flush_pending_refresh()
+            refresh.assert_called_once()
+        assert display._refresh_pending is False
+
+    def test_progress_only_redraws_on_whole_percent_change(self, display):
+        """Test that sub-percent progress steps do not request a redraw."""
+        display.update_progress(0, 1000)
+        display._refresh_pending = False
+        for i in range(1, 10):
+            display.update_progress(i, 1000)
+        assert display._refresh_pending is False
+        assert display.progress_current == 9
+        display.update_progress(10, 1000)
+        assert display._refresh_pending is True
+
+    def test_progress_redraws_on_completion_and_description(self, display):
+        """Test that completion and new descriptions always request a redraw."""
+        display.update_batch_progress(0, 3)
+        display._refresh_pending = False
+        display.update_batch_progress(0, 3, description="Batch 2")
+        assert display._refresh_pending is True
+        display._refresh_pending = False
+        display.update_progress(999, 1000)
+        display._refresh_pending = False
+        display.update_progress(1000, 1000)
+        assert display._refresh_pending is True
+
+    def test_progress_panels_are_built_once(self, display):
+        """Test that progress renders reuse the same panels around the live bars."""
+        display.update_progress(5, 10)
+        display.reset_batch_progress(20)
+        first = display._render_progress()
+        second = display._render_progress()
+        assert first.children[0].renderable is display._progress_panel
+        assert second.children[0].renderable is display._progress_panel
+        assert second.children[1].renderable is display._batch_panel
+        assert display._progress.tasks[0].completed == 5
+
+    def test_controls_panel_is_prebuilt_per_selection(self, display):
+        """Test that controls panels are looked up rather than rebuilt."""
+        assert len(display._controls_panels) == len(display._controls)
+        display._selected_control = 2
+        assert display._render_controls() is display._controls_panels[2]
+
+    def test_stop_sets_flag(self, display):
         """Test that stop() sets the running flag to False."""
-        display = PerformanceDisplay()
         display._is_running = True
         display.stop()
         assert display._is_running is False
 
 
+@pytest.fixture
+def fast_switching():
+    """Force very frequent thread switches so racing updates interleave."""
+    old = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(old)
+
+
+@pytest.mark.usefixtures("fast_switching")
 class TestPerformanceDisplayThreadSafety:
     """Test thread safety of the display system."""
 
-    def test_concurrent_metric_updates(self):
+    WORKERS = 4
+
+    def _race(self, target, args_list):
+        """Start one thread per args tuple and release them all at once."""
+        barrier = threading.Barrier(len(args_list) + 1)
+
+        def run(*args):
+            barrier.wait()
+            target(*args)
+
+        threads = [threading.Thread(target=run, args=args) for args in args_list]
+        for t in threads:
+            t.start()
+        barrier.wait()
+        for t in threads:
+            t.join()
+
+    def test_concurrent_metric_updates(self, display):
         """Test that concurrent metric updates don't corrupt data."""
-        display = PerformanceDisplay()
 
         def update_metrics(worker_id):
             for i in range(50):
@@ -203,35 +370,38 @@ class TestPerformanceDisplayThreadSafety:
                     'shared_counter': i
                 })
 
-        threads = [
-            threading.Thread(target=update_metrics, args=(f"w{i}",))
-            for i in range(4)
-        ]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-        for i in range(4):
-            assert f'metric_w{i}' in display.metrics
+        self._race(update_metrics, [(f"w{i}",) for i in range(self.WORKERS)])
+        for i in range(self.WORKERS):
+            assert display.metrics[f'metric_w{i}'] == 49
+        assert display.metrics['shared_counter'] == 49
 
-    def test_concurrent_progress_updates(self):
+    def test_concurrent_progress_updates(self, display):
         """Test that concurrent progress updates are handled safely."""
-        display = PerformanceDisplay()
 
         def update_progress():
             for i in range(50):
                 display.update_progress(i, 100)
 
-        threads = [
-            threading.Thread(target=update_progress)
-            for _ in range(4)
-        ]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        self._race(update_progress, [() for _ in range(self.WORKERS)])
         assert 0 <= display.progress_current <= 100
 
+    def test_updates_race_with_display_flush(self, display):
+        """Test that rendering while workers publish updates stays consistent."""
+
+        def update_metrics(worker_id):
+            for i in range(50):
+                display.update_metrics({f'metric_{worker_id}': i})
+                display.update_progress(i, 50)
+
+        def flush():
+            for _ in range(50):
+                display._flush_pending_refresh()
+
+        args = [(update_metrics, f"w{i}") for i in range(self.WORKERS)] + [(flush,)]
+        self._race(lambda fn, *rest: fn(*rest), args)
+        display._flush_pending_refresh()
+        assert display._last_rendered["metrics"] is display.metrics
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,50 +1,45 @@
-import io
-import sys
-import time
-import unittest
-from unittest.mock import patch, MagicMock, call
+import pytest
+from unittest.mock import MagicMock
 
-# Mock tqdm at the module level
-mock_tqdm = MagicMock()
-mock_tqdm.return_value = MagicMock()
+from src.driver_manager.progress import DownloadProgress
 
-with patch('tqdm.tqdm', mock_tqdm):
-    from src.driver_manager.progress import DownloadProgress
 
-class TestDownloadProgress(unittest.TestCase):
+@pytest.fixture(autouse=True)
+def mock_tqdm(monkeypatch):
+    """Replace tqdm in the progress module; monkeypatch restores it after each test."""
+    mock = MagicMock()
+    monkeypatch.setattr('src.driver_manager.progress.tqdm', mock)
+    return mock
+
+
+class TestDownloadProgress:
     """Test cases for DownloadProgress class"""
-    
+
     def test_download_progress_init(self):
         """Test initialization of DownloadProgress"""
         progress = DownloadProgress()
-        self.assertIsNone(progress.pbar)
-        self.assertEqual(progress.start_time, 0.0)
+        assert progress.pbar is None
+        assert progress.start_time_ns == 0
 
-    def test_download_progress_init_with_params(self):
+    def test_download_progress_init_with_params(self, mock_tqdm):
         """Test initialization with parameters"""
-        # Reset mock before test
-        mock_tqdm.reset_mock()
-        
         progress = DownloadProgress()
         progress.init(1024, "Test Download")
-        
-        self.assertGreater(progress.start_time, 0)
+
+        assert progress.start_time_ns > 0
         mock_tqdm.assert_called_once()
         args, kwargs = mock_tqdm.call_args
-        self.assertEqual(kwargs['total'], 1024)
-        self.assertEqual(kwargs['desc'], "Test Download")
-        self.assertEqual(kwargs['unit'], 'B')
-        self.assertTrue(kwargs['unit_scale'])
-        
-        # Reset mock after test
-        mock_tqdm.reset_mock()
+        assert kwargs['total'] == 1024
+        assert kwargs['desc'] == "Test Download"
+        assert kwargs['unit'] == 'B'
+        assert kwargs['unit_scale']
 
     def test_download_progress_update(self):
         """Test progress update functionality"""
         progress = DownloadProgress()
         mock_pbar = MagicMock()
         progress.pbar = mock_pbar
-        
+
         progress.update(100)
         mock_pbar.update.assert_called_once_with(100)
 
@@ -53,48 +48,37 @@ class TestDownloadProgress(unittest.TestCase):
         progress = DownloadProgress()
         mock_pbar = MagicMock()
         progress.pbar = mock_pbar
-        
+
         progress.close()
         mock_pbar.close.assert_called_once()
-        self.assertIsNone(progress.pbar)
+        assert progress.pbar is None
 
-    def test_download_progress_context_manager(self):
+    def test_download_progress_context_manager(self, mock_tqdm):
         """Test progress bar as context manager"""
-        # Reset mock before test
-        mock_tqdm.reset_mock()
-        
         progress = DownloadProgress()
         progress.init(1024, "Test Download")
         progress.update(512)
         progress.close()
-        
+
         # Get the mock pbar instance that was created
         mock_pbar = mock_tqdm.return_value
         mock_pbar.update.assert_called_once_with(512)
         mock_pbar.close.assert_called_once()
-        
-        # Reset mock after test
-        mock_tqdm.reset_mock()
 
-    def test_download_progress_output(self):
+    def test_download_progress_output(self, mock_tqdm):
         """Test progress bar output format"""
-        # Reset mock before test
-        mock_tqdm.reset_mock()
-        
         progress = DownloadProgress()
         progress.init(1024, "Test Download")
         progress.update(512)
         progress.close()
-        
+
         # Verify tqdm was called with expected format
         args, kwargs = mock_tqdm.call_args
-        self.assertIn('bar_format', kwargs)
-        self.assertIn('{n_fmt}', kwargs['bar_format'])
-        self.assertIn('{total_fmt}', kwargs['bar_format'])
-        self.assertIn('ETA', kwargs['bar_format'])
-        
-        # Reset mock after test
-        mock_tqdm.reset_mock()
+        assert 'bar_format' in kwargs
+        assert '{n_fmt}' in kwargs['bar_format']
+        assert '{total_fmt}' in kwargs['bar_format']
+        assert 'ETA' in kwargs['bar_format']
+
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__, "-v"])
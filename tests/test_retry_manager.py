@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import threading
 import time
+from src.core.exceptions import RetryCancelledError
 from src.core.retry_manager import RetryManager, NetworkRetryManager
 
 class TestRetryManager(unittest.TestCase):
@@ -23,6 +25,20 @@ class TestRetryManager(unittest.TestCase):
         for delay in delays:
             self.assertGreaterEqual(delay, 0)
 
+    def test_calculate_delays_schedule(self):
+        """Test that calculate_delays matches the per-attempt backoff formula."""
+        manager = RetryManager(base_delay=1.0, max_delay=5.0, jitter_factor=0.0)
+        self.assertEqual(manager.calculate_delays(4), [1.0, 2.0, 4.0, 5.0])
+        self.assertEqual(manager.calculate_delays(4), [manager.calculate_delay(i) for i in range(4)])
+        self.assertEqual(manager.calculate_delays(0), [])
+
+    def test_calculate_delays_with_jitter(self):
+        """Test that jittered delays stay within the jitter band."""
+        delays = self.retry_manager.calculate_delays(3)
+        for delay, expected in zip(delays, [1.0, 2.0, 4.0]):
+            self.assertGreaterEqual(delay, expected * 0.9)
+            self.assertLessEqual(delay, expected * 1.1)
+
     def test_retry_operation_success_first_attempt(self):
         """Test successful operation on first attempt."""
         mock_operation = MagicMock(return_value="success")
@@ -66,6 +82,76 @@ class TestRetryManager(unittest.TestCase):
         self.assertEqual(result, "success")
         self.assertEqual(mock_operation.call_count, 2)
 
+    def test_retry_operation_accepts_exception_list(self):
+        """Test that retryable_exceptions may be given as a list."""
+        manager = RetryManager(max_attempts=2, base_delay=0.0)
+        mock_operation = MagicMock()
+        mock_operation.side_effect = [KeyError("missing"), "success"]
+
+        result = manager.retry_operation(mock_operation, retryable_exceptions=[ValueError, KeyError])
+
+        self.assertEqual(result, "success")
+
+    def test_retry_operation_accepts_single_exception_class(self):
+        """Test that retryable_exceptions may be a bare exception class."""
+        manager = RetryManager(max_attempts=2, base_delay=0.0)
+        mock_operation = MagicMock(side_effect=[ValueError("custom error"), "success"])
+
+        self.assertEqual(manager.retry_operation(mock_operation, retryable_exceptions=ValueError), "success")
+
+        @manager.retry_decorator(retryable_exceptions=ValueError)
+        def decorated():
+            return mock_operation()
+
+        mock_operation.side_effect = [ValueError("custom error"), "ok"]
+        self.assertEqual(decorated(), "ok")
+
+    def test_retry_operation_does_not_retry_other_exceptions(self):
+        """Test that exceptions outside retryable_exceptions propagate immediately."""
+        mock_operation = MagicMock(side_effect=KeyError("missing"))
+
+        with self.assertRaises(KeyError):
+            self.retry_manager.retry_operation(mock_operation, retryable_exceptions=(ValueError,))
+        mock_operation.assert_called_once()
+
+    def test_cancel_interrupts_backoff_wait(self):
+        """Test that cancel() wakes a retry that is waiting out its delay."""
+        manager = RetryManager(max_attempts=2, base_delay=30.0, jitter_factor=0.0)
+        mock_operation = MagicMock(side_effect=Exception("fail"))
+        errors = []
+
+        def run():
+            try:
+                manager.retry_operation(mock_operation)
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=run)
+        start = time.monotonic()
+        worker.start()
+        while mock_operation.call_count == 0:
+            time.sleep(0.01)
+        manager.cancel()
+        worker.join(timeout=5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], RetryCancelledError)
+        self.assertIsInstance(errors[0], RuntimeError)
+        mock_operation.assert_called_once()
+
+    def test_reset_rearms_after_cancel(self):
+        """Test that a cancelled manager retries again once reset."""
+        manager = RetryManager(max_attempts=2, base_delay=0.0)
+        manager.cancel()
+        with self.assertRaises(RetryCancelledError):
+            manager.retry_operation(MagicMock(side_effect=[ValueError("fail"), "success"]))
+
+        manager.reset()
+        mock_operation = MagicMock(side_effect=[ValueError("fail"), "success"])
+        self.assertEqual(manager.retry_operation(mock_operation), "success")
+
     def test_retry_decorator(self):
         """Test retry decorator functionality."""
         call_count = 0
@@ -85,6 +171,11 @@ class TestRetryManager(unittest.TestCase):
 class TestNetworkRetryManager(unittest.TestCase):
     def setUp(self):
         self.network_retry_manager = NetworkRetryManager(max_attempts=2)
+        # FlashscoreScraper.close() elsewhere in the run marks the calling thread as
+        # shutting down, which makes retry_network_operation abort immediately
+        thread = threading.current_thread()
+        self.addCleanup(setattr, thread, '_is_shutting_down', getattr(thread, '_is_shutting_down', False))
+        thread._is_shutting_down = False
 
     def test_network_retry_operation(self):
         """Test network-specific retry operation."""
@@ -96,6 +187,17 @@ class TestNetworkRetryManager(unittest.TestCase):
         self.assertEqual(result, "success")
         self.assertEqual(mock_operation.call_count, 2)
 
+    @patch('src.core.network_monitor.NetworkMonitor')
+    def test_network_retry_uses_backoff_schedule(self, mock_monitor):
+        """Test that network retries take their delays from calculate_delays."""
+        mock_monitor.return_value.is_connected.return_value = True
+        manager = NetworkRetryManager(max_attempts=3)
+        mock_operation = MagicMock(side_effect=[Exception("timeout"), Exception("timeout"), "success"])
+
+        with patch.object(manager, 'calculate_delays', return_value=[0.0, 0.0]) as delays:
+            self.assertEqual(manager.retry_network_operation(mock_operation), "success")
+        delays.assert_called_once_with(2)
+
     def test_network_exceptions_configured(self):
         """Test that network exceptions are properly configured."""
         expected_exceptions = (ConnectionError, TimeoutError, OSError)
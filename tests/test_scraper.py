@@ -3,84 +3,107 @@
 Tests for FlashscoreScraper class
 """
 
-import sys
-import os
-import unittest
-from unittest.mock import Mock, patch, MagicMock
+import threading
+import time
 
-# Add the project root to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from src.scraper import FlashscoreScraper
+import src.scraper as scraper_module
+from src.core.exceptions import RetryCancelledError
+from src.core.retry_manager import NetworkRetryManager
 from src.models import MatchModel, OddsModel, H2HMatchModel
+from src.reporting import NullReporter
+from tests.fakes import MemoryStorage
 
 
-class TestFlashscoreScraper(unittest.TestCase):
-    """Test cases for FlashscoreScraper class"""
+# Collaborator classes the scraper instantiates; replaced by mocks in every test
+PATCHED_CLASSES = (
+    'WebDriverManager',
+    'MatchDataLoader',
+    'OddsDataLoader',
+    'MatchDataExtractor',
+    'OddsDataExtractor',
+    'H2HDataExtractor',
+)
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.scraper = FlashscoreScraper()
 
-    @patch('src.scraper.WebDriverManager')
-    def test_initialize(self, mock_driver_manager):
+# Attribute names of each real class, introspected once so every test's mocks
+# can be spec'd without repeating the dir() walk
+_CLASS_SPECS = {name: dir(getattr(scraper_module, name)) for name in PATCHED_CLASSES}
+
+
+@pytest.fixture(autouse=True)
+def scraper_deps(monkeypatch):
+    """Patch the scraper's collaborator classes once per test via monkeypatch."""
+    deps = SimpleNamespace(**{name: Mock(spec=_CLASS_SPECS[name]) for name in PATCHED_CLASSES})
+    for name in PATCHED_CLASSES:
+        monkeypatch.setattr(f'src.scraper.{name}', getattr(deps, name))
+    return deps
+
+
+class TestFlashscoreScraper:
+    """Test cases for FlashscoreScraper class; the scraper fixture comes from conftest.py"""
+
+    def test_initialize(self, scraper_deps):
         """Test scraper initialization"""
-        mock_manager_instance = Mock()
-        mock_driver_manager.return_value = mock_manager_instance
+        mock_driver_manager = scraper_deps.WebDriverManager
+        mock_manager_instance = mock_driver_manager.return_value
         mock_driver = Mock()
         mock_manager_instance.get_driver.return_value = mock_driver
+        # No driver_factory, so the scraper builds its manager from the patched class
+        scraper = scraper_module.FlashscoreScraper(
+            reporter=NullReporter(), storage=MemoryStorage(), config_snapshot={}
+        )
         
-        self.scraper.initialize()
+        scraper.initialize()
         
         mock_manager_instance.initialize.assert_called_once()
         mock_manager_instance.get_driver.assert_called_once()
-        self.assertEqual(self.scraper.driver, mock_driver)
+        assert scraper.driver == mock_driver
 
-    @patch('src.scraper.MatchDataLoader')
-    @patch('src.scraper.OddsDataLoader')
-    def test_load_initial_data(self, mock_odds_loader, mock_match_loader):
+    def test_load_initial_data(self, scraper, scraper_deps):
         """Test loading initial data"""
+        mock_odds_loader = scraper_deps.OddsDataLoader
+        mock_match_loader = scraper_deps.MatchDataLoader
         # Mock the driver and selenium_utils
-        self.scraper.driver = Mock()
-        self.scraper.selenium_utils = Mock()
+        scraper.driver = Mock()
+        scraper.selenium_utils = Mock()
         
         # Mock the loaders
-        mock_match_instance = Mock()
-        mock_match_loader.return_value = mock_match_instance
+        mock_match_instance = mock_match_loader.return_value
         mock_match_instance.get_today_match_ids.return_value = ['match1', 'match2', 'match3']
         
-        mock_odds_instance = Mock()
-        mock_odds_loader.return_value = mock_odds_instance
+        mock_odds_instance = mock_odds_loader.return_value
         
-        result = self.scraper.load_initial_data()
+        result = scraper.load_initial_data()
         
-        self.assertEqual(result, ['match1', 'match2', 'match3'])
+        assert result == ['match1', 'match2', 'match3']
         mock_match_instance.load_main_page.assert_called_once()
         mock_match_instance.get_today_match_ids.assert_called_once()
 
-    @patch('src.scraper.MatchDataLoader')
-    @patch('src.scraper.OddsDataLoader')
-    def test_load_initial_data_no_today_matches(self, mock_odds_loader, mock_match_loader):
+    def test_load_initial_data_no_today_matches(self, scraper, scraper_deps):
         """Test loading initial data when no today matches are available"""
+        mock_odds_loader = scraper_deps.OddsDataLoader
+        mock_match_loader = scraper_deps.MatchDataLoader
         # Mock the driver and selenium_utils
-        self.scraper.driver = Mock()
-        self.scraper.selenium_utils = Mock()
+        scraper.driver = Mock()
+        scraper.selenium_utils = Mock()
         
         # Mock the loaders
-        mock_match_instance = Mock()
-        mock_match_loader.return_value = mock_match_instance
+        mock_match_instance = mock_match_loader.return_value
         mock_match_instance.get_today_match_ids.return_value = []
         mock_match_instance.get_tomorrow_match_ids.return_value = ['tomorrow1', 'tomorrow2']
         
-        mock_odds_instance = Mock()
-        mock_odds_loader.return_value = mock_odds_instance
+        mock_odds_instance = mock_odds_loader.return_value
         
-        result = self.scraper.load_initial_data()
+        result = scraper.load_initial_data()
         
-        self.assertEqual(result, ['tomorrow1', 'tomorrow2'])
+        assert result == ['tomorrow1', 'tomorrow2']
         mock_match_instance.get_tomorrow_match_ids.assert_called_once()
 
-    def test_validate_odds_data_complete(self):
+    def test_validate_odds_data_complete(self, scraper):
         """Test odds validation with complete data"""
         odds = OddsModel(match_id='test')
         odds.home_odds = 1.85
@@ -89,12 +112,12 @@ class TestFlashscoreScraper(unittest.TestCase):
         odds.over_odds = 1.85
         odds.under_odds = 1.95
         
-        is_incomplete, missing_fields = self.scraper.validate_odds_data(odds)
+        is_incomplete, missing_fields = scraper.validate_odds_data(odds)
         
-        self.assertFalse(is_incomplete)
-        self.assertEqual(len(missing_fields), 0)
+        assert not is_incomplete
+        assert len(missing_fields) == 0
 
-    def test_validate_odds_data_incomplete(self):
+    def test_validate_odds_data_incomplete(self, scraper):
         """Test odds validation with incomplete data"""
         odds = OddsModel(match_id='test')
         odds.home_odds = 1.85
@@ -103,109 +126,105 @@ class TestFlashscoreScraper(unittest.TestCase):
         odds.over_odds = None  # Missing
         odds.under_odds = 1.95
         
-        is_incomplete, missing_fields = self.scraper.validate_odds_data(odds)
+        is_incomplete, missing_fields = scraper.validate_odds_data(odds)
         
-        self.assertTrue(is_incomplete)
-        self.assertIn('away_odds', missing_fields)
-        self.assertIn('over_odds', missing_fields)
-        self.assertEqual(len(missing_fields), 2)
+        assert is_incomplete
+        assert 'away_odds' in missing_fields
+        assert 'over_odds' in missing_fields
+        assert len(missing_fields) == 2
 
-    def test_compose_skip_reason(self):
+    def test_compose_skip_reason(self, scraper):
         """Test composing skip reason"""
         # Test with odds incomplete
         odds_incomplete = True
         missing_odds_fields = ['home_odds', 'away_odds']
         h2h_count = 8
         
-        reason = self.scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
+        reason = scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
         
-        self.assertIn('missing or invalid odds fields: home_odds, away_odds', reason)
-        self.assertNotIn('insufficient H2H matches', reason)
+        assert 'missing or invalid odds fields: home_odds, away_odds' in reason
+        assert 'insufficient H2H matches' not in reason
 
-    def test_compose_skip_reason_insufficient_h2h(self):
+    def test_compose_skip_reason_insufficient_h2h(self, scraper):
         """Test composing skip reason with insufficient H2H matches"""
         # Test with insufficient H2H
         odds_incomplete = False
         missing_odds_fields = []
         h2h_count = 3  # Less than required
         
-        reason = self.scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
+        reason = scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
         
-        self.assertIn('insufficient H2H matches (3 found, 6 required)', reason)
-        self.assertNotIn('missing or invalid odds fields', reason)
+        assert 'insufficient H2H matches (3 found, 6 required)' in reason
+        assert 'missing or invalid odds fields' not in reason
 
-    def test_compose_skip_reason_both_issues(self):
+    def test_compose_skip_reason_both_issues(self, scraper):
         """Test composing skip reason with both odds and H2H issues"""
         odds_incomplete = True
         missing_odds_fields = ['home_odds']
         h2h_count = 2
         
-        reason = self.scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
+        reason = scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
         
-        self.assertIn('missing or invalid odds fields: home_odds', reason)
-        self.assertIn('insufficient H2H matches (2 found, 6 required)', reason)
+        assert 'missing or invalid odds fields: home_odds' in reason
+        assert 'insufficient H2H matches (2 found, 6 required)' in reason
 
-    def test_compose_skip_reason_no_issues(self):
+    def test_compose_skip_reason_no_issues(self, scraper):
         """Test composing skip reason with no issues"""
         odds_incomplete = False
         missing_odds_fields = []
         h2h_count = 8
         
-        reason = self.scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
+        reason = scraper.compose_skip_reason(odds_incomplete, missing_odds_fields, h2h_count)
         
-        self.assertEqual(reason, "")
+        assert reason == ""
 
-    @patch('src.scraper.MatchDataExtractor')
-    def test_extract_match_data(self, mock_extractor_class):
+    def test_extract_match_data(self, scraper, scraper_deps):
         """Test extracting match data"""
-        mock_extractor_instance = Mock()
-        mock_extractor_class.return_value = mock_extractor_instance
+        mock_extractor_class = scraper_deps.MatchDataExtractor
+        mock_extractor_instance = mock_extractor_class.return_value
         mock_match_data = Mock()
         mock_extractor_instance.extract_match_data.return_value = mock_match_data
         
-        self.scraper.match_loader = Mock()
+        scraper.match_loader = Mock()
         
-        result = self.scraper.extract_match_data()
+        result = scraper.extract_match_data()
         
-        self.assertEqual(result, mock_match_data)
+        assert result == mock_match_data
         mock_extractor_instance.extract_match_data.assert_called_once()
 
-    @patch('src.scraper.OddsDataExtractor')
-    def test_extract_home_away_odds(self, mock_extractor_class):
+    def test_extract_home_away_odds(self, scraper, scraper_deps):
         """Test extracting home/away odds"""
-        mock_extractor_instance = Mock()
-        mock_extractor_class.return_value = mock_extractor_instance
+        mock_extractor_class = scraper_deps.OddsDataExtractor
+        mock_extractor_instance = mock_extractor_class.return_value
         mock_extractor_instance.home_odds = '1.85'
         mock_extractor_instance.away_odds = '2.10'
         
-        self.scraper.home_away_loader = Mock()
+        scraper.home_away_loader = Mock()
         
-        home_odds, away_odds = self.scraper.extract_home_away_odds()
+        home_odds, away_odds = scraper.extract_home_away_odds()
         
-        self.assertEqual(home_odds, 1.85)
-        self.assertEqual(away_odds, 2.10)
+        assert home_odds == 1.85
+        assert away_odds == 2.10
         mock_extractor_instance.extract_home_away_odds.assert_called_once()
 
-    @patch('src.scraper.OddsDataExtractor')
-    def test_extract_home_away_odds_none_values(self, mock_extractor_class):
+    def test_extract_home_away_odds_none_values(self, scraper, scraper_deps):
         """Test extracting home/away odds with None values"""
-        mock_extractor_instance = Mock()
-        mock_extractor_class.return_value = mock_extractor_instance
+        mock_extractor_class = scraper_deps.OddsDataExtractor
+        mock_extractor_instance = mock_extractor_class.return_value
         mock_extractor_instance.home_odds = None
         mock_extractor_instance.away_odds = None
         
-        self.scraper.home_away_loader = Mock()
+        scraper.home_away_loader = Mock()
         
-        home_odds, away_odds = self.scraper.extract_home_away_odds()
+        home_odds, away_odds = scraper.extract_home_away_odds()
         
-        self.assertIsNone(home_odds)
-        self.assertIsNone(away_odds)
+        assert home_odds is None
+        assert away_odds is None
 
-    @patch('src.scraper.OddsDataExtractor')
-    def test_extract_over_under_odds(self, mock_extractor_class):
+    def test_extract_over_under_odds(self, scraper, scraper_deps):
         """Test extracting over/under odds"""
-        mock_extractor_instance = Mock()
-        mock_extractor_class.return_value = mock_extractor_instance
+        mock_extractor_class = scraper_deps.OddsDataExtractor
+        mock_extractor_instance = mock_extractor_class.return_value
         
         # Mock the selected alternative
         selected_alternative = {
@@ -215,35 +234,33 @@ class TestFlashscoreScraper(unittest.TestCase):
         }
         mock_extractor_instance.get_selected_alternative.return_value = selected_alternative
         
-        self.scraper.over_under_loader = Mock()
+        scraper.over_under_loader = Mock()
         
-        match_total, over_odds, under_odds = self.scraper.extract_over_under_odds()
+        match_total, over_odds, under_odds = scraper.extract_over_under_odds()
         
-        self.assertEqual(match_total, 153.5)
-        self.assertEqual(over_odds, 1.85)
-        self.assertEqual(under_odds, 1.95)
+        assert match_total == 153.5
+        assert over_odds == 1.85
+        assert under_odds == 1.95
         mock_extractor_instance.extract_over_under_odds.assert_called_once()
 
-    @patch('src.scraper.OddsDataExtractor')
-    def test_extract_over_under_odds_no_selection(self, mock_extractor_class):
+    def test_extract_over_under_odds_no_selection(self, scraper, scraper_deps):
         """Test extracting over/under odds when no alternative is selected"""
-        mock_extractor_instance = Mock()
-        mock_extractor_class.return_value = mock_extractor_instance
+        mock_extractor_class = scraper_deps.OddsDataExtractor
+        mock_extractor_instance = mock_extractor_class.return_value
         mock_extractor_instance.get_selected_alternative.return_value = None
         
-        self.scraper.over_under_loader = Mock()
+        scraper.over_under_loader = Mock()
         
-        match_total, over_odds, under_odds = self.scraper.extract_over_under_odds()
+        match_total, over_odds, under_odds = scraper.extract_over_under_odds()
         
-        self.assertIsNone(match_total)
-        self.assertIsNone(over_odds)
-        self.assertIsNone(under_odds)
+        assert match_total is None
+        assert over_odds is None
+        assert under_odds is None
 
-    @patch('src.scraper.H2HDataExtractor')
-    def test_extract_h2h_matches(self, mock_extractor_class):
+    def test_extract_h2h_matches(self, scraper, scraper_deps):
         """Test extracting H2H matches"""
-        mock_extractor_instance = Mock()
-        mock_extractor_class.return_value = mock_extractor_instance
+        mock_extractor_class = scraper_deps.H2HDataExtractor
+        mock_extractor_instance = mock_extractor_class.return_value
         
         # Mock H2H data
         mock_h2h_data = [Mock(), Mock(), Mock()]  # 3 matches
@@ -257,25 +274,25 @@ class TestFlashscoreScraper(unittest.TestCase):
         mock_extractor_instance.get_away_score.side_effect = [80, 85, 88]
         mock_extractor_instance.get_competition.side_effect = ['League1', 'League1', 'League2']
         
-        self.scraper.h2h_loader = Mock()
-        self.scraper.h2h_loader.get_h2h_count.return_value = 3
+        scraper.h2h_loader = Mock()
+        scraper.h2h_loader.get_h2h_count.return_value = 3
         
-        h2h_matches, h2h_count = self.scraper.extract_h2h_matches('test_match_id')
+        h2h_matches, h2h_count = scraper.extract_h2h_matches('test_match_id')
         
-        self.assertEqual(len(h2h_matches), 3)
-        self.assertEqual(h2h_count, 3)
+        assert len(h2h_matches) == 3
+        assert h2h_count == 3
         
         # Check first match
         first_match = h2h_matches[0]
-        self.assertEqual(first_match.match_id, 'test_match_id')
-        self.assertEqual(first_match.date, '2023-01-01')
-        self.assertEqual(first_match.home_team, 'Team A')
-        self.assertEqual(first_match.away_team, 'Team B')
-        self.assertEqual(first_match.home_score, 85)
-        self.assertEqual(first_match.away_score, 80)
-        self.assertEqual(first_match.competition, 'League1')
-
-    def test_log_match_info(self):
+        assert first_match.match_id == 'test_match_id'
+        assert first_match.date == '2023-01-01'
+        assert first_match.home_team == 'Team A'
+        assert first_match.away_team == 'Team B'
+        assert first_match.home_score == 85
+        assert first_match.away_score == 80
+        assert first_match.competition == 'League1'
+
+    def test_log_match_info(self, scraper):
         """Test logging match information"""
         # Create a test match
         odds = OddsModel(match_id='test')
@@ -310,8 +327,43 @@ class TestFlashscoreScraper(unittest.TestCase):
         )
         
         # This should not raise any exceptions
-        self.scraper.log_match_info(match)
+        scraper.log_match_info(match)
+
+    def test_close_cancels_pending_retry_backoff(self, scraper, monkeypatch):
+        """Test that close() wakes a retry waiting out its backoff on another thread."""
+        # close() marks the calling thread as shutting down; undo that after the test
+        monkeypatch.setattr(threading.current_thread(), '_is_shutting_down', False, raising=False)
+        manager = scraper.retry_manager = NetworkRetryManager(max_attempts=2, base_delay=30.0, jitter_factor=0.0)
+        operation = Mock(side_effect=ValueError("fail"))
+        errors = []
+
+        def run():
+            try:
+                manager.retry_operation(operation)
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=run)
+        start = time.monotonic()
+        worker.start()
+        while operation.call_count == 0:
+            time.sleep(0.01)
+        scraper.close()
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        assert time.monotonic() - start < 5
+        assert len(errors) == 1 and isinstance(errors[0], RetryCancelledError)
+
+    def test_initialize_rearms_cancelled_retry_manager(self, scraper):
+        """Test that a new run clears a cancel left over from the previous stop."""
+        scraper.cancel_retries()
+        scraper._driver = Mock()
+        scraper.initialize()
+        operation = Mock(side_effect=[ValueError("fail"), "ok"])
+        scraper.retry_manager.base_delay = 0.0
+        assert scraper.retry_manager.retry_operation(operation) == "ok"
 
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    pytest.main([__file__, "-v"]) 
\ No newline at end of file
@@ -1,110 +1,59 @@
-import unittest
-
-from typing import Optional
+import pytest
 
 from src.scraper import FlashscoreScraper
 from src.reporting import NullReporter, CaptureReporter
+from tests.fakes import FakeDriverManager, MemoryStorage
 
 
-class FakeDriver:
-    current_url = "about:blank"
-    def quit(self):
-        pass
-    def implicitly_wait(self, t):
-        pass
-
-
-class FakeDriverManager:
-    def __init__(self):
-        self._driver = FakeDriver()
-        self.chrome_log_path: Optional[str] = None
-    def initialize(self) -> None:
-        pass
-    def get_driver(self):
-        return self._driver
-    def close(self, force: bool = False) -> None:
-        pass
-
-
-class MemoryStorage:
-    def __init__(self):
-        self.saved = {}
-    def save_matches(self, matches, filename: Optional[str] = None) -> bool:
-        self.saved[filename or "matches.json"] = [m.to_dict() for m in matches]
-        return True
-    def save_results(self, results, filename: Optional[str] = None) -> bool:
-        self.saved[filename or "results.json"] = results
-        return True
-    def load_matches(self, filename):
-        # Return empty for simplicity
-        return []
-
-
-class TestScraperDependencies(unittest.TestCase):
+class TestScraperDependencies:
     def test_initializes_with_injected_dependencies(self):
         reporter = NullReporter()
         storage = MemoryStorage()
         scraper = FlashscoreScraper(
             reporter=reporter,
-            driver_factory=lambda: FakeDriverManager(),
+            driver_factory=FakeDriverManager,
             storage=storage,
             config_snapshot={"browser": {"headless": True}},
         )
         # Access driver to trigger creation
         _ = scraper.driver
-        self.assertIsNotNone(scraper.driver)
+        assert scraper.driver is not None
 
     def test_reporter_receives_status_and_progress(self):
         reporter = CaptureReporter()
         scraper = FlashscoreScraper(
             reporter=reporter,
-            driver_factory=lambda: FakeDriverManager(),
+            driver_factory=FakeDriverManager,
             storage=MemoryStorage(),
             config_snapshot={}
         )
         # Call a few methods that should emit status/progress safely
         scraper.reporter.status("hello")
         scraper.reporter.progress(1, 2, "msg")
-        self.assertIn("hello", reporter.statuses)
-        self.assertIn((1, 2, "msg"), reporter.progresses)
+        assert "hello" in reporter.statuses
+        assert (1, 2, "msg") in reporter.progresses
 
     def test_defaults_work_without_injections(self):
         # Should construct with defaults; do not actually start a browser here
         scraper = FlashscoreScraper()
-        self.assertIsNotNone(scraper)
+        assert scraper is not None
 
-    def test_cli_fallback_printing(self):
+    def test_cli_fallback_printing(self, capsys):
         """Test that CallbackReporter falls back to print() when no callbacks provided."""
         from src.reporting import CallbackReporter
-        import io
-        import sys
-        
-        # Capture stdout
-        captured_output = io.StringIO()
-        original_stdout = sys.stdout
-        sys.stdout = captured_output
-        
-        try:
-            # Create reporter with no callbacks (CLI fallback scenario)
-            reporter = CallbackReporter()
-            
-            # Test status fallback
-            reporter.status("Test status message")
-            output = captured_output.getvalue()
-            self.assertIn("Test status message", output)
-            
-            # Clear output
-            captured_output.seek(0)
-            captured_output.truncate(0)
-            
-            # Test progress fallback
-            reporter.progress(2, 5, "Loading data")
-            output = captured_output.getvalue()
-            self.assertIn("Progress: 2/5", output)
-            self.assertIn("Loading data", output)
-            
-        finally:
-            sys.stdout = original_stdout
+
+        # Create reporter with no callbacks (CLI fallback scenario)
+        reporter = CallbackReporter()
+
+        # Test status fallback
+        reporter.status("Test status message")
+        assert "Test status message" in capsys.readouterr().out
+
+        # Test progress fallback
+        reporter.progress(2, 5, "Loading data")
+        output = capsys.readouterr().out
+        assert "Progress: 2/5" in output
+        assert "Loading data" in output
 
     def test_batch_progress_and_current_task_updates(self):
         """Test that scraper reports batch progress and current task updates."""
@@ -114,7 +63,7 @@ class TestScraperDependencies(unittest.TestCase):
         reporter = CaptureReporter()
         scraper = FlashscoreScraper(
             reporter=reporter,
-            driver_factory=lambda: FakeDriverManager(),
+            driver_factory=FakeDriverManager,
             storage=MemoryStorage(),
             config_snapshot={"browser": {"headless": True}}
         )
@@ -130,19 +79,19 @@ class TestScraperDependencies(unittest.TestCase):
         scraper.reporter.progress(2, 10, "Extracting match data")
         
         # Verify we received multiple progress updates with different task descriptions
-        self.assertGreater(len(reporter.progresses), 5, "Should receive multiple progress updates")
+        assert len(reporter.progresses) > 5, "Should receive multiple progress updates"
         
         # Verify we have different task descriptions
         task_descriptions = [p[2] for p in reporter.progresses if p[2] is not None]
         unique_tasks = set(task_descriptions)
-        self.assertGreater(len(unique_tasks), 3, f"Should have multiple unique task descriptions, got: {unique_tasks}")
+        assert len(unique_tasks) > 3, f"Should have multiple unique task descriptions, got: {unique_tasks}"
         
         # Verify we have the expected task descriptions
         expected_tasks = {"Loading match page", "Extracting match data", "Extracting odds data", "Loading H2H data", "Saving match data"}
-        self.assertTrue(expected_tasks.issubset(unique_tasks), f"Missing expected tasks. Got: {unique_tasks}")
+        assert expected_tasks.issubset(unique_tasks), f"Missing expected tasks. Got: {unique_tasks}"
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__, "-v"])
 
 
@@ -3,7 +3,14 @@ from unittest.mock import Mock, patch
 from src.utils.selenium_utils import SeleniumUtils
 
 class DummyDriver:
-    pass
+    """Driver whose page exposes fixed (date, status) header texts."""
+    def __init__(self, date_text=None, status_text=None):
+        self.texts = [date_text, status_text]
+        self.script_calls = 0
+
+    def execute_script(self, script, *args):
+        self.script_calls += 1
+        return list(self.texts)
 
 @pytest.fixture
 def selenium_utils():
@@ -14,26 +21,52 @@ def make_elem(text):
     elem.text = text
     return elem
 
-@patch.object(SeleniumUtils, 'find')
-def test_get_match_status_scheduled(mock_find, selenium_utils):
-    # Simulate empty status, date in fixedScore__status
-    mock_find.side_effect = [make_elem('\xa0'), make_elem('15.07.2025 11:00')]
-    assert selenium_utils.get_match_status() == 'scheduled'
+def test_get_match_status_scheduled():
+    # Empty status, date in fixedScore__status
+    utils = SeleniumUtils(DummyDriver('15.07.2025 11:00', '\xa0'))
+    assert utils.get_match_status() == 'scheduled'
 
-@patch.object(SeleniumUtils, 'find')
-def test_get_match_status_live(mock_find, selenium_utils):
-    # Simulate live status
-    mock_find.side_effect = [make_elem('1st Quarter')]
-    assert selenium_utils.get_match_status() == 'live'
+def test_get_match_status_live():
+    utils = SeleniumUtils(DummyDriver(None, '1st Quarter'))
+    assert utils.get_match_status() == 'live'
+
+def test_get_match_status_finished():
+    utils = SeleniumUtils(DummyDriver('', 'FT'))
+    assert utils.get_match_status() == 'finished'
+
+def test_get_match_status_uses_one_script_call():
+    driver = DummyDriver(None, 'Finished')
+    utils = SeleniumUtils(driver)
+    with patch.object(SeleniumUtils, 'find') as mock_find:
+        assert utils.get_match_status() == 'finished'
+    assert driver.script_calls == 1
+    mock_find.assert_not_called()
 
 @patch.object(SeleniumUtils, 'find')
-def test_get_match_status_finished(mock_find, selenium_utils):
-    # Simulate finished status
-    mock_find.side_effect = [make_elem('FT')]
+def test_get_match_status_falls_back_to_find(mock_find, selenium_utils):
+    selenium_utils.driver.execute_script = Mock(side_effect=Exception("no JS"))
+    # find() is called for the date element first, then the status element
+    mock_find.side_effect = [None, make_elem('FT')]
     assert selenium_utils.get_match_status() == 'finished'
+    assert mock_find.call_count == 2
 
 @patch.object(SeleniumUtils, 'find')
 def test_get_match_status_unknown(mock_find, selenium_utils):
-    # Simulate no elements found
-    mock_find.side_effect = [None, None]
-    assert selenium_utils.get_match_status() == 'unknown' 
\ No newline at end of file
+    # Neither the script nor find() can read the page
+    selenium_utils.driver.execute_script = Mock(side_effect=Exception("no JS"))
+    mock_find.side_effect = Exception("session lost")
+    assert selenium_utils.get_match_status() == 'unknown'
+
+def test_batch_text_reads_all_targets_in_one_call():
+    driver = DummyDriver('12:00', 'FT')
+    utils = SeleniumUtils(driver)
+    assert utils.batch_text(['.a', '.b']) == ['12:00', 'FT']
+    assert driver.script_calls == 1
+    assert utils.batch_text([]) == []
+    assert driver.script_calls == 1
+
+def test_batch_text_falls_back_per_element(selenium_utils):
+    selenium_utils.driver.execute_script = Mock(side_effect=Exception("no JS"))
+    with patch.object(SeleniumUtils, 'find', return_value=make_elem('by selector')):
+        assert selenium_utils.batch_text(['.a', make_elem('by element'), None]) == [
+            'by selector', 'by element', None]
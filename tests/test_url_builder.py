@@ -51,3 +51,36 @@ def test_parse_summary_url_invalid_domain():
 def test_parse_summary_url_missing_mid():
     with pytest.raises(ValueError, match="Missing match ID"):
         UrlBuilder.parse_summary_url("https://www.flashscore.co.ke/match/basketball/x-y/a-b/summary/")
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.flashscore.co.ke/match/basketball/instituto-de-cordoba-rJPlbMMq/olimpico-ERbTiFhJ/summary/?mid=raxc7DVh",
+    "https://www.flashscore.com/match/basketball/a-b-c-X1/d-Y2/?mid=Z3",
+    "https://www.flashscore.co.ke/match/basketball/x-y/a-b/odds/home-away/ft-including-ot/?mid=XYZ",
+    # Non-canonical forms fall back to the general parser
+    "https://www.flashscore.co.ke/match/basketball/x-y/a-b/summary/?foo=1&mid=XYZ",
+    "https://www.flashscore.co.ke//match/basketball/x-y/a-b/summary/?mid=XYZ#top",
+])
+def test_parse_summary_url_round_trips(url):
+    data = UrlBuilder.parse_summary_url(url)
+    rebuilt = UrlBuilder(**data).summary()
+    assert UrlBuilder.parse_summary_url(rebuilt) == data
+
+
+def test_builder_urls_are_built_once_and_track_changes():
+    b = UrlBuilder(mid="abc", home_slug="x", home_id="Y1", away_slug="a", away_id="B2")
+    assert b.summary() is b.summary()
+    b.mid = "def"
+    assert b.summary().endswith("/summary/?mid=def")
+    b.home_slug = "Not Valid"
+    with pytest.raises(ValueError, match="Invalid home_slug"):
+        b.h2h()
+
+
+def test_parse_summary_url_is_memoized_but_returns_fresh_dicts():
+    url = "https://www.flashscore.co.ke/match/basketball/x-Y1/a-B2/summary/?mid=C3"
+    first = UrlBuilder.parse_summary_url(url)
+    first["mid"] = "changed"
+    hits = UrlBuilder._parse_components.cache_info().hits
+    assert UrlBuilder.parse_summary_url(url)["mid"] == "C3"
+    assert UrlBuilder._parse_components.cache_info().hits == hits + 1